@@ -0,0 +1,17 @@
+"""JSON helpers backed by orjson when it is installed, falling back to the standard library."""
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def dumps_bytes(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:  # without orjson, use the stdlib encoder/decoder
+    import json
+    from json import loads, dumps
+
+    def dumps_bytes(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode()
@@ -33,7 +33,7 @@ class ChatInterface:
             print()
             # Display tools that were called
             if full_tool_calls:
-                tool_names = [call["name"] for call in full_tool_calls.values()]
+                tool_names = [call["function"]["name"] for call in full_tool_calls.values()]
                 print(f"  [Tools called: {', '.join(tool_names)}]")
                 logger.info(f"Tools called: {', '.join(tool_names)}")
         return True
@@ -206,4 +206,9 @@ async def main():
         await interface.run()
         
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional (and unavailable on Windows), the stock loop works everywhere
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
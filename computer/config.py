@@ -94,6 +94,29 @@ class Config:
     def get_api_key() -> str:
         return os.getenv("API_KEY", "none")
     
+    @staticmethod
+    def get_http_max_connections() -> int:
+        return int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    
+    @staticmethod
+    def get_http_max_keepalive_connections() -> int:
+        return int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    
+    @staticmethod
+    def get_http_keepalive_expiry() -> float:
+        return float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+    
+    @staticmethod
+    def get_context_window() -> int | None:
+        """The model's context size in tokens. Automatic pruning only runs when this is set."""
+        window = os.getenv("CONTEXT_WINDOW")
+        return int(window) if window else None
+    
+    @staticmethod
+    def get_fast_commands() -> bool:
+        """Answer trivial read-only terminal commands (pwd, ls, cat, ...) in-process instead of spawning them."""
+        return os.getenv("FAST_COMMANDS", "false").lower() in ("1", "true", "yes")
+    
     @staticmethod
     def get_system_prompt() -> str:
         p = os.getenv("SYSTEM_PROMPT", try_get_file(os.getenv("SYSTEM_PROMPT_FILE", "SYSTEM.txt"), Config.DEFAULT_SYSTEM_PROMPT))
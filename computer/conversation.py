@@ -1,11 +1,14 @@
-import json
 from discord import datetime
 from typing_extensions import Literal
 
+from computer._json import dumps, loads
 from computer.config import Config
 import hashlib
 import aiofiles
 
+# content that replaces tool results removed by pruning
+PRUNED_CONTENT = "DELETED FOR CONVENIENCE"
+
 
 class Conversation:
     def __init__(self, system_messages: list[str] | None = None):
@@ -49,6 +52,77 @@ class Conversation:
         """
         self._mask = n
         
+    @staticmethod
+    def estimate_tokens(message: dict) -> int:
+        """Rough token count of a message, about 4 characters per token including tool call metadata."""
+        size = len(message.get("content") or "")
+        for call in message.get("tool_calls") or ():
+            function = call.get("function", {})
+            size += len(call.get("id") or "") + len(function.get("name") or "") + len(function.get("arguments") or "")
+        return size // 4
+
+    def token_count(self) -> int:
+        return sum(map(Conversation.estimate_tokens, self.history))
+
+    def prune(self, limit: int, target: int | None = None, keep_recent: int = 10) -> int:
+        """
+        Once the conversation exceeds limit tokens, shrink it to roughly target (default: limit) tokens.
+        Old tool results are stubbed out first, then the oldest user/assistant messages are dropped along
+        with the tool results that answer them. System messages and the last keep_recent messages are
+        kept verbatim. Returns the tokens freed.
+        """
+        total = sum(map(Conversation.estimate_tokens, self._history))
+        if total <= limit:
+            return 0
+        if target is None:
+            target = limit
+        start = total
+        cutoff = max(0, len(self._history) - keep_recent)
+
+        for m in self._history[:cutoff]:
+            if total <= target:
+                break
+            if m["role"] == "tool" and m["content"] != PRUNED_CONTENT:
+                total -= Conversation.estimate_tokens(m)
+                m["content"] = PRUNED_CONTENT
+                total += Conversation.estimate_tokens(m)
+
+        if total > target:
+            kept: list[dict] = []
+            dropped_calls: set[str] = set()
+            dropped = 0
+            for i, m in enumerate(self._history):
+                # a tool result has to follow its assistant call, so it goes exactly when that call goes
+                if m["role"] == "tool":
+                    drop = m.get("tool_call_id") in dropped_calls
+                else:
+                    drop = i < cutoff and m["role"] != "system" and total > target
+                if drop:
+                    total -= Conversation.estimate_tokens(m)
+                    dropped += 1
+                    dropped_calls.update(call["id"] for call in m.get("tool_calls") or ())
+                    continue
+                kept.append(m)
+            self._history = kept
+            if self._mask is not None:
+                self._mask = max(0, self._mask - dropped)
+
+        return start - total
+
+    def clone(self) -> "Conversation":
+        """
+        Copy the conversation without deepcopy. Messages are flat dicts of strings, so a
+        copy of each message (and of its tool_calls list) is enough to keep them independent.
+        """
+        conv = Conversation.__new__(Conversation)
+        conv._history = [
+            {**m, "tool_calls": list(m["tool_calls"])} if m.get("tool_calls") else m.copy()
+            for m in self._history
+        ]
+        conv.system_messages = list(self.system_messages)
+        conv._mask = self._mask
+        return conv
+        
     def serialize(self) -> dict:
         return {
             "time": datetime.now().isoformat(),
@@ -88,7 +162,7 @@ class ConversationStorage:
         filename = hash(tag) + ".json"
         file = Config.cache_path() / filename
         async with aiofiles.open(file, "w") as f:
-            await f.write(json.dumps(conversation.serialize()))
+            await f.write(dumps(conversation.serialize()))
             
     @staticmethod
     def load(tag: str) -> Conversation | None:
@@ -97,8 +171,8 @@ class ConversationStorage:
         filename = hash(tag) + ".json"
         try:
             file = Config.cache_path() / filename
-            with open(file, "r") as f:
-                data = json.load(f)
+            with open(file, "rb") as f:
+                data = loads(f.read())
                 return Conversation.deserialize(data)
         except FileNotFoundError:
             return None
\ No newline at end of file
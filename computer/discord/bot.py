@@ -179,7 +179,7 @@ def tool_description(tools: dict[int, dict], computer: Computer) -> tuple[str, s
                 f"```yaml\n{pydantic_pretty_print(tool_args)}```"
             )
 
-    names = {tool["name"] for tool in tools.values() if "name" in tool}
+    names = {tool["function"]["name"] for tool in tools.values() if tool["function"].get("name")}
     
     return "\n".join(descriptions), names
 
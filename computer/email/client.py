@@ -1,15 +1,24 @@
+import base64
+import math
 import os
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable
 from imapclient import IMAPClient
 import email
 from email.message import EmailMessage
 from email.header import decode_header
+from email.parser import BytesHeaderParser
 from email.utils import parsedate_to_datetime
+import quopri
 import smtplib
+import time
 import asyncio
 import dotenv
 import logging
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache, partial
 
 dotenv.load_dotenv("secret.env")
 
@@ -22,31 +31,196 @@ SMTP_PORT = 587
 USERNAME = os.getenv("GMAIL_USERNAME")
 PASSWORD = os.getenv("GMAIL_PASSWORD")
 TRASH_FOLDER = '[Gmail]/Trash'  # Gmail's trash folder name
+IMAP_TIMEOUT = 30  # seconds, so a stalled server can't hold a session's lock forever
+SMTP_TIMEOUT = 30  # seconds, likewise for the pooled SMTP connection
 
+# Stops at the end of the headers, the body is only parsed when it is read
+_HEADER_PARSER = BytesHeaderParser()
+
+# Blocking IMAP/SMTP calls run on their own bounded pool rather than the default executor.
+# Sized to cover the parallel fetch connections plus one-off searches and sends.
+_IMAP_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='imap')
+
+async def run_blocking(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _IMAP_EXECUTOR,
+        partial(func, *args, **kwargs)
+    )
+
+# FETCH data items, pre-encoded so IMAPClient doesn't re-encode them on every call.
+# BODY.PEEK[] returns the full message without setting the \Seen flag.
+_FETCH_FULL = [b'BODY.PEEK[]']
+# ...and the key its data comes back under
+_KEY_BODY = b'BODY[]'
+
+class SmtpPool:
+    """
+    Holds a single authenticated SMTP connection that is reused across sends.
+    Connecting, upgrading to TLS and logging in dominate the cost of sending, so
+    that is done once and the connection is probed with NOOP before each reuse.
+    """
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._server: smtplib.SMTP | None = None
+        self._lock = asyncio.Lock()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+        try:
+            server.starttls()
+            server.login(USERNAME, PASSWORD)  # type: ignore
+        except Exception:
+            server.close()
+            raise
+        logger.info("Opened SMTP connection to %s:%s", self.host, self.port)
+        return server
+
+    def _ensure(self) -> smtplib.SMTP:
+        """Return a live connection, reconnecting if the cached one was dropped."""
+        if self._server is not None:
+            try:
+                code, _ = self._server.noop()
+                if code == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            logger.info("SMTP connection is stale, reconnecting")
+            self.close()
+        self._server = self._connect()
+        return self._server
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            self._server.close()
+        self._server = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[smtplib.SMTP]:
+        """Exclusive access to the pooled connection. It is discarded if the caller fails."""
+        async with self._lock:
+            server = await run_blocking(self._ensure)
+            try:
+                yield server
+            except Exception:
+                await run_blocking(self.close)
+                raise
+
+    async def send(self, msg: EmailMessage) -> None:
+        """Send a message over the pooled connection. Concurrent sends are queued on the lock."""
+        async with self.acquire() as server:
+            await run_blocking(server.send_message, msg)
+
+SMTP_POOL = SmtpPool(SMTP_HOST, SMTP_PORT)
+
+class ImapSession:
+    """
+    Holds a single logged-in IMAP connection that is reused for searches, deletes and
+    unread checks, so the TLS handshake and LOGIN are paid once rather than per call.
+    A connection that sat idle long enough for the server to drop it is probed with
+    NOOP before reuse.
+    """
+    # Gmail closes connections idle for about 30 minutes
+    PROBE_AFTER_IDLE = 25 * 60
+
+    def __init__(self, host: str):
+        self.host = host
+        self._client: IMAPClient | None = None
+        self._folder: str | None = None
+        self._last_used = 0.0
+        self._lock = asyncio.Lock()
+
+    def _connect(self) -> IMAPClient:
+        client = IMAPClient(self.host, timeout=IMAP_TIMEOUT)
+        try:
+            client.login(USERNAME, PASSWORD)  # type: ignore
+        except Exception:
+            client.shutdown()
+            raise
+        logger.info("Opened IMAP connection to %s", self.host)
+        return client
+
+    def _ensure(self, folder: str) -> IMAPClient:
+        """Return a live connection with folder selected, reconnecting if the cached one was dropped."""
+        if self._client is not None and time.monotonic() - self._last_used > self.PROBE_AFTER_IDLE:
+            try:
+                self._client.noop()
+            except Exception:
+                logger.info("IMAP connection is stale, reconnecting")
+                self.close()
+        if self._client is None:
+            self._client = self._connect()
+            self._folder = None
+        if self._folder != folder:
+            self._client.select_folder(folder)
+            self._folder = folder
+        return self._client
+
+    def close(self):
+        if self._client is None:
+            return
+        try:
+            self._client.logout()
+        except Exception:
+            self._client.shutdown()
+        self._client = None
+        self._folder = None
+
+    @asynccontextmanager
+    async def acquire(self, folder: str = 'INBOX') -> AsyncIterator[IMAPClient]:
+        """Exclusive access to the session with folder selected. It is discarded if the caller fails."""
+        async with self._lock:
+            client = await run_blocking(self._ensure, folder)
+            try:
+                yield client
+            except Exception:
+                await run_blocking(self.close)
+                raise
+            finally:
+                self._last_used = time.monotonic()
+
+IMAP_SESSION = ImapSession(IMAP_HOST)
+
+@dataclass(slots=True)
 class Email:
-    def __init__(
-        self, 
-        uid, 
-        sender, 
-        subject,
-        body,
-        date=None,
-        to=None,
-        cc=None
-    ):
-        self.uid = uid
-        self.sender = sender
-        self.subject = subject
-        self.body = body
-        self.date = date
-        self.to = to
-        self.cc = cc
+    uid: int
+    sender: str
+    subject: str
+    date: str | None = None
+    to: str | None = None
+    cc: str | None = None
+    # raw RFC822 bytes, only decoded into a body the first time it is read
+    _raw: bytes | None = field(default=None, repr=False)
+    _body: str | None = field(default=None, repr=False)
     
     def __repr__(self):
         return f"Email(uid={self.uid}, sender='{self.sender}', subject='{self.subject}', date='{self.date}')"
 
-    
-    def serialize(self):
+    @property
+    def body(self) -> str:
+        if self._body is None:
+            self._body = Email.get_body(email.message_from_bytes(self._raw)) if self._raw else ""  # type: ignore
+            self._raw = None
+        return self._body
+
+    def body_preview(self, n: int = 100) -> str:
+        """The first n characters of the body, decoding only as much of the payload as needed"""
+        if self._body is not None or not self._raw:
+            return self.body[:n]
+        part = Email.get_body_part(email.message_from_bytes(self._raw))
+        if part is None:
+            return ""
+        try:
+            return Email.decode_payload_prefix(part, n)
+        except Exception:
+            return self.body[:n]
+
+    def serialize(self) -> dict:
         """Convert Email object to a dictionary for easier serialization"""
         return {
             "uid": self.uid,
@@ -75,38 +249,49 @@ class Email:
         
         return decoded_string
 
+    @staticmethod
+    def get_body_part(msg):
+        """Find the part holding the readable body: the first text/plain part, else the first text/html one"""
+        if not msg.is_multipart():
+            return msg
+        
+        html_part = None
+        for part in msg.walk():
+            if "attachment" in str(part.get("Content-Disposition")):
+                continue
+            content_type = part.get_content_type()
+            if content_type == "text/plain":
+                return part
+            if content_type == "text/html" and html_part is None:
+                html_part = part
+        return html_part
+
     @staticmethod
     def get_body(msg):
         """Extract email body from multipart or plain message"""
-        body = ""
-        
-        if msg.is_multipart():
-            # Iterate through email parts
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                content_disposition = str(part.get("Content-Disposition"))
-                
-                # Get text/plain parts
-                if content_type == "text/plain" and "attachment" not in content_disposition:
-                    try:
-                        body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                        break
-                    except:
-                        pass
-                # If no text/plain, try text/html
-                elif content_type == "text/html" and not body and "attachment" not in content_disposition:
-                    try:
-                        body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                    except:
-                        pass
+        part = Email.get_body_part(msg)
+        if part is None:
+            return ""
+        try:
+            return part.get_payload(decode=True).decode('utf-8', errors='ignore')
+        except:
+            return "" if msg.is_multipart() else str(msg.get_payload())
+
+    @staticmethod
+    def decode_payload_prefix(part, n: int) -> str:
+        """Decode roughly the first n characters of a part without decoding the whole payload"""
+        encoded = part.get_payload()
+        encoding = str(part.get('Content-Transfer-Encoding', '')).strip().lower()
+        if encoding == 'base64':
+            # a UTF-8 character is at most 4 bytes, which is under 6 base64 characters
+            compact = "".join(encoded[:8 * n].split())
+            data = base64.b64decode(compact[:len(compact) // 4 * 4])
+        elif encoding == 'quoted-printable':
+            # an encoded byte is at most 3 characters ("=XX")
+            data = quopri.decodestring(encoded[:12 * n].encode('ascii', errors='ignore'))
         else:
-            # Not multipart - get payload directly
-            try:
-                body = msg.get_payload(decode=True).decode('utf-8', errors='ignore')
-            except:
-                body = str(msg.get_payload())
-        
-        return body
+            data = part.get_payload(decode=True)
+        return data.decode('utf-8', errors='ignore')[:n]
 
     @staticmethod
     def get(client: IMAPClient, uid=None) -> "Email | None":
@@ -119,14 +304,21 @@ class Email:
             uid = messages[-1]
         
         # Fetch the email data without marking as read using BODY.PEEK
-        raw_message = client.fetch([uid], ['BODY.PEEK[]'])
+        raw_message = client.fetch([uid], _FETCH_FULL)
         
         if uid not in raw_message:
             return None
         
         # Parse the email (BODY.PEEK[] returns the same data as RFC822 but doesn't set \Seen flag)
-        email_body = raw_message[uid][b'BODY[]']
-        msg = email.message_from_bytes(email_body)  # type: ignore
+        return Email.from_raw(uid, raw_message[uid][_KEY_BODY])
+
+    @staticmethod
+    def from_raw(uid, raw: bytes) -> "Email":
+        """
+        Build an Email from the raw RFC822 bytes returned by a FETCH.
+        Only the headers are parsed here.
+        """
+        msg = _HEADER_PARSER.parsebytes(raw)
         
         # Extract email details
         sender = Email.decode_header_value(msg.get('From', ''))
@@ -135,22 +327,67 @@ class Email:
         to = Email.decode_header_value(msg.get('To', ''))
         cc = Email.decode_header_value(msg.get('Cc', ''))
         
-        # Extract body
-        body = Email.get_body(msg)
-        
+        # The body is decoded lazily from the raw bytes
         return Email(
             uid=uid,
             sender=sender,
             subject=subject,
-            body=body,
             date=date,
             to=to,
-            cc=cc
+            cc=cc,
+            _raw=raw
         )
+
+    @staticmethod
+    def get_many(client: IMAPClient, uids: list[int]) -> list["Email"]:
+        """Fetch several emails with a single FETCH command, preserving the order of uids"""
+        if not uids:
+            return []
+        raw_messages = client.fetch(uids, _FETCH_FULL)
+        emails = {
+            uid: Email.from_raw(uid, data[_KEY_BODY])
+            for uid, data in raw_messages.items()
+        }
+        return [emails[uid] for uid in uids if uid in emails]
         
 type Hook = Callable[[Email], None]
 type AsyncHook = Callable[[Email], asyncio.Future]
 
+# Large fetches are split across several connections. Gmail allows 15 concurrent
+# IMAP connections per account, stay well below that.
+PARALLEL_FETCH_THRESHOLD = 50
+MAX_FETCH_CONNECTIONS = 4
+_FETCH_SEMAPHORE = asyncio.Semaphore(MAX_FETCH_CONNECTIONS)
+
+async def fetch_emails_parallel(uids: list[int], folder: str = 'INBOX') -> list[Email]:
+    """
+    Fetch emails by UID, splitting the work over up to MAX_FETCH_CONNECTIONS connections.
+    
+    Args:
+        uids: UIDs to fetch
+        folder: Folder the UIDs belong to
+        
+    Returns:
+        List of Email objects in the same order as uids
+    """
+    def _fetch_chunk(chunk: list[int]) -> list[Email]:
+        with IMAPClient(IMAP_HOST, timeout=IMAP_TIMEOUT) as client:
+            client.login(USERNAME, PASSWORD)  # type: ignore
+            client.select_folder(folder, readonly=True)
+            return Email.get_many(client, chunk)
+
+    async def _worker(chunk: list[int]) -> list[Email]:
+        async with _FETCH_SEMAPHORE:
+            return await run_blocking(_fetch_chunk, chunk)
+
+    workers = min(MAX_FETCH_CONNECTIONS, math.ceil(len(uids) / PARALLEL_FETCH_THRESHOLD))
+    chunk_size = math.ceil(len(uids) / workers)
+    chunks = [uids[i:i + chunk_size] for i in range(0, len(uids), chunk_size)]
+    logger.info("Fetching %d email(s) over %d connection(s)", len(uids), len(chunks))
+    
+    results = await asyncio.gather(*(_worker(chunk) for chunk in chunks))
+    return [email_obj for chunk_emails in results for email_obj in chunk_emails]
+
 async def delete_email_imap(uid: int) -> bool:
     """
     Move an email to the trash bin by UID.
@@ -161,25 +398,56 @@ async def delete_email_imap(uid: int) -> bool:
     Returns:
         True if email was successfully moved to trash, False otherwise
     """
-    def _delete():
-        try:
-            with IMAPClient(IMAP_HOST) as client:
-                client.login(USERNAME, PASSWORD)  # type: ignore
-                client.select_folder('INBOX')
-                
-                # Copy the email to trash
-                client.copy([uid], TRASH_FOLDER)
-                client.delete_messages([uid])
-                client.expunge()
-                
-                logger.info(f"Email UID {uid} moved to trash")
-                return True
-                
-        except Exception as e:
-            logger.error(f"Failed to delete email UID {uid}: {e}")
-            return False
+    def _delete(client: IMAPClient):
+        # Copy the email to trash
+        client.copy([uid], TRASH_FOLDER)
+        client.delete_messages([uid])
+        client.expunge()
     
-    return await asyncio.to_thread(_delete)
+    try:
+        async with IMAP_SESSION.acquire('INBOX') as client:
+            await run_blocking(_delete, client)
+        logger.info("Email UID %s moved to trash", uid)
+        return True
+    except Exception as e:
+        logger.error("Failed to delete email UID %s: %s", uid, e)
+        return False
+
+@lru_cache(maxsize=256)
+def _build_imap_criteria(
+    unread_only: bool,
+    from_address: str | None,
+    subject: str | None,
+    body: str | None,
+    since: date | None,
+    before: date | None,
+) -> tuple:
+    """Build (and memoize) the IMAP SEARCH criteria for a set of filters"""
+    criteria = []
+    
+    if unread_only:
+        criteria.append('UNSEEN')
+    
+    if from_address:
+        criteria.extend(['FROM', from_address])
+    
+    if subject:
+        criteria.extend(['SUBJECT', subject])
+    
+    if body:
+        criteria.extend(['BODY', body])
+    
+    if since:
+        criteria.extend(['SINCE', since])
+    
+    if before:
+        criteria.extend(['BEFORE', before])
+    
+    # If no criteria specified, search for all
+    if not criteria:
+        criteria = ['ALL']
+    
+    return tuple(criteria)
 
 async def search_emails_imap(
     from_address: str | None = None,
@@ -189,10 +457,13 @@ async def search_emails_imap(
     before: datetime | None = None,
     unread_only: bool = False,
     folder: str = 'INBOX',
-    max_return: int = 10
-) -> list[Email]:
+    batch_size: int = 10
+) -> AsyncIterator[Email]:
     """
-    Search for emails based on various criteria.
+    Search for emails based on various criteria, yielding matches newest first.
+    
+    Matches are fetched batch_size at a time over the shared IMAP session, so a
+    consumer that stops early never downloads the rest.
     
     Args:
         from_address: Filter by sender email address (partial match)
@@ -202,87 +473,63 @@ async def search_emails_imap(
         before: Only include emails received before this datetime
         unread_only: If True, only return unread emails
         folder: Which folder to search in (default: 'INBOX')
+        batch_size: How many emails to fetch per FETCH command
         
-    Returns:
-        List of Email objects matching the search criteria
+    Yields:
+        Email objects matching the search criteria
     """
-    def _search():
-        emails = []
-        
+    criteria = _build_imap_criteria(
+        unread_only,
+        from_address,
+        subject,
+        body,
+        since.date() if since else None,
+        before.date() if before else None,
+    )
+    logger.info("Searching with criteria: %s", criteria)
+    
+    try:
+        async with IMAP_SESSION.acquire(folder) as client:
+            message_uids = await run_blocking(client.search, list(criteria))
+    except Exception as e:
+        logger.error("Error searching emails: %s", e)
+        return
+    
+    if not message_uids:
+        logger.info("No emails found matching search criteria")
+        return
+    
+    logger.info("Found %d email(s) matching criteria", len(message_uids))
+    
+    # UIDs ascend with arrival, walk them from the newest end one batch at a time.
+    # The session is only held per FETCH, so other mail calls can interleave with a slow consumer
+    newest_first = message_uids[::-1]
+    for start in range(0, len(newest_first), batch_size):
+        batch = newest_first[start:start + batch_size]
         try:
-            with IMAPClient(IMAP_HOST) as client:
-                client.login(USERNAME, PASSWORD)  # type: ignore
-                client.select_folder(folder)
-                
-                # Build search criteria
-                criteria = []
-                
-                if unread_only:
-                    criteria.append('UNSEEN')
-                
-                if from_address:
-                    criteria.extend(['FROM', from_address])
-                
-                if subject:
-                    criteria.extend(['SUBJECT', subject])
-                
-                if body:
-                    criteria.extend(['BODY', body])
-                
-                if since:
-                    criteria.extend(['SINCE', since.date()])
-                
-                if before:
-                    criteria.extend(['BEFORE', before.date()])
-                
-                # If no criteria specified, search for all
-                if not criteria:
-                    criteria = ['ALL']
-                
-                logger.info(f"Searching with criteria: {criteria}")
-                
-                # Perform search
-                message_uids = client.search(criteria)  # type: ignore
-                
-                if not message_uids:
-                    logger.info("No emails found matching search criteria")
-                    return emails[:max_return]
-                
-                logger.info(f"Found {len(message_uids)} email(s) matching criteria")
-                
-                # Fetch each matching email
-                for uid in message_uids:
-                    email_obj = Email.get(client, uid)
+            async with IMAP_SESSION.acquire(folder) as client:
+                fetched = await run_blocking(Email.get_many, client, batch)
+        except Exception as e:
+            logger.error("Error searching emails: %s", e)
+            return
+        
+        for email_obj in fetched:
+            # Apply time-based filtering if needed (SINCE/BEFORE only use date precision)
+            if email_obj.date:
+                try:
+                    email_date = parsedate_to_datetime(email_obj.date)
                     
-                    if email_obj:
-                        # Apply time-based filtering if needed (SINCE/BEFORE only use date precision)
-                        if email_obj.date:
-                            try:
-                                email_date = parsedate_to_datetime(email_obj.date)
-                                
-                                # Check time-based filters with precision
-                                if since and email_date < since:
-                                    continue
-                                if before and email_date >= before:
-                                    continue
-                                    
-                            except Exception as e:
-                                logger.warning(f"Could not parse date for email UID {uid}: {e}")
+                    # Check time-based filters with precision
+                    if since and email_date < since:
+                        continue
+                    if before and email_date >= before:
+                        continue
                         
-                        emails.append(email_obj)
-                        if len(emails) == max_return:
-                            logger.info(f"Reached max return limit of {max_return} emails")
-                            break
-                        logger.debug(f"Added email UID {uid} from {email_obj.sender}")
-                
-                logger.info(f"Returning {len(emails)} email(s) after filtering")
-                return emails[:max_return]
-                
-        except Exception as e:
-            logger.error(f"Error searching emails: {e}")
-            return []
-    
-    return await asyncio.to_thread(_search)
+                except Exception as e:
+                    logger.warning("Could not parse date for email UID %s: %s", email_obj.uid, e)
+            
+            logger.debug("Yielding email UID %s from %s", email_obj.uid, email_obj.sender)
+            yield email_obj
 
 async def send_smtp(
     to: str | list[str],
@@ -306,53 +553,47 @@ async def send_smtp(
     Returns:
         True if email was sent successfully, False otherwise
     """
-    def _send():
-        try:
-            # Create message using modern EmailMessage
-            msg = EmailMessage()
-            msg["Subject"] = subject
-            msg["From"] = USERNAME
-            
-            # Handle single or multiple recipients
-            if isinstance(to, list):
-                msg["To"] = ", ".join(to)
+    try:
+        # Create message using modern EmailMessage
+        msg = EmailMessage()
+        msg["Subject"] = subject
+        msg["From"] = USERNAME
+        
+        # Handle single or multiple recipients
+        if isinstance(to, list):
+            msg["To"] = ", ".join(to)
+        else:
+            msg["To"] = to
+        
+        # Handle CC if provided
+        if cc:
+            if isinstance(cc, list):
+                msg["Cc"] = ", ".join(cc)
             else:
-                msg["To"] = to
-            
-            # Handle CC if provided
-            if cc:
-                if isinstance(cc, list):
-                    msg["Cc"] = ", ".join(cc)
-                else:
-                    msg["Cc"] = cc
-            
-            # Handle BCC if provided
-            if bcc:
-                if isinstance(bcc, list):
-                    msg["Bcc"] = ", ".join(bcc)
-                else:
-                    msg["Bcc"] = bcc
-            
-            # Set content (EmailMessage handles HTML vs plain text automatically)
-            if html:
-                msg.set_content(body, subtype='html')
+                msg["Cc"] = cc
+        
+        # Handle BCC if provided
+        if bcc:
+            if isinstance(bcc, list):
+                msg["Bcc"] = ", ".join(bcc)
             else:
-                msg.set_content(body)
-            
-            # Connect to SMTP server and send
-            with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-                server.starttls()
-                server.login(USERNAME, PASSWORD)  # type: ignore
-                server.send_message(msg)
-            
-            logger.info(f"Email sent successfully to {msg['To']}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to send email: {e}")
-            return False
-    
-    return await asyncio.to_thread(_send)
+                msg["Bcc"] = bcc
+        
+        # Set content (EmailMessage handles HTML vs plain text automatically)
+        if html:
+            msg.set_content(body, subtype='html')
+        else:
+            msg.set_content(body)
+        
+        # Send over the pooled connection (connects and logs in on first use)
+        await SMTP_POOL.send(msg)
+        
+        logger.info("Email sent successfully to %s", msg['To'])
+        return True
+        
+    except Exception as e:
+        logger.error("Failed to send email: %s", e)
+        return False
 
 async def get_unread_emails(since: datetime) -> list[Email]:
     """
@@ -364,68 +605,72 @@ async def get_unread_emails(since: datetime) -> list[Email]:
     Returns:
         List of Email objects that are unread and within the time window
     """
-    def _get_unread():
-        emails = []
+    def _get_unread(client: IMAPClient) -> tuple[list[Email], list[int]]:
+        # Use server-side search with date filter
+        # IMAP SINCE uses date only (not time), so we use the date of 'since'
+        search_date = since.date()
         
-        with IMAPClient(IMAP_HOST) as client:
-            client.login(USERNAME, PASSWORD) # type: ignore
-            client.select_folder('INBOX')
-            
-            # Use server-side search with date filter
-            # IMAP SINCE uses date only (not time), so we use the date of 'since'
-            search_date = since.date()
-            
-            # Search for unread messages since the specified date
-            # The server will filter before returning UIDs - much more efficient
-            unread_uids = client.search(['UNSEEN', 'SINCE', search_date])  # type: ignore
-            
-            if not unread_uids:
-                logger.info("No unread emails found")
-                return emails
-            
-            logger.info(f"Found {len(unread_uids)} unread email(s) since {search_date}")
-            
-            for uid in unread_uids:
-                # Fetch the email
-                email_obj = Email.get(client, uid)
+        # Search for unread messages since the specified date
+        # The server will filter before returning UIDs - much more efficient
+        unread_uids = client.search(['UNSEEN', 'SINCE', search_date])  # type: ignore
+        
+        if not unread_uids:
+            logger.info("No unread emails found")
+            return [], []
+        
+        logger.info("Found %d unread email(s) since %s", len(unread_uids), search_date)
+        
+        if len(unread_uids) > PARALLEL_FETCH_THRESHOLD:
+            # too many for one connection, fetched in parallel below
+            return [], unread_uids
+        return Email.get_many(client, unread_uids), []
+    
+    async with IMAP_SESSION.acquire('INBOX') as client:
+        fetched, deferred = await run_blocking(_get_unread, client)
+    if deferred:
+        fetched = await fetch_emails_parallel(deferred)
+    
+    emails = []
+    for email_obj in fetched:
+        uid = email_obj.uid
+        if email_obj.date:
+            try:
+                # Parse the email date
+                email_date = parsedate_to_datetime(email_obj.date)
                 
-                if email_obj and email_obj.date:
-                    try:
-                        # Parse the email date
-                        email_date = parsedate_to_datetime(email_obj.date)
-                        
-                        # Double-check with time precision (SINCE only checks date)
-                        if email_date >= since:
-                            emails.append(email_obj)
-                            logger.debug(f"Added email UID {uid} from {email_obj.sender}")
-                        else:
-                            logger.debug(f"Skipped email UID {uid} - too old ({email_date})")
-                    except Exception as e:
-                        logger.warning(f"Could not parse date for email UID {uid}: {e}")
-                        # Include emails with unparseable dates to be safe
-                        emails.append(email_obj)
-                elif email_obj:
-                    # Include emails without dates to be safe
-                    logger.warning(f"Email UID {uid} has no date, including anyway")
+                # Double-check with time precision (SINCE only checks date)
+                if email_date >= since:
                     emails.append(email_obj)
-            
-            logger.info(f"Returning {len(emails)} unread email(s) since {since}")
-            return emails
+                    logger.debug("Added email UID %s from %s", uid, email_obj.sender)
+                else:
+                    logger.debug("Skipped email UID %s - too old (%s)", uid, email_date)
+            except Exception as e:
+                logger.warning("Could not parse date for email UID %s: %s", uid, e)
+                # Include emails with unparseable dates to be safe
+                emails.append(email_obj)
+        else:
+            # Include emails without dates to be safe
+            logger.warning("Email UID %s has no date, including anyway", uid)
+            emails.append(email_obj)
     
-    return await asyncio.to_thread(_get_unread)
+    logger.info("Returning %d unread email(s) since %s", len(emails), since)
+    return emails
 
 async def monitor_mailbox(hook: Hook | AsyncHook | None = None):
     """Monitor mailbox for new emails and trigger hook when received"""
+    # async hooks are scheduled back onto this loop from the monitor thread
+    loop = asyncio.get_running_loop()
+    
     def _monitor_sync():
-        with IMAPClient(IMAP_HOST) as client:
+        with IMAPClient(IMAP_HOST, timeout=IMAP_TIMEOUT) as client:
             client.login(USERNAME, PASSWORD) # type: ignore
-            client.select_folder('INBOX')
+            folder_info = client.select_folder('INBOX')
             
-            # Get initial message count to track new emails
-            initial_messages = client.search('ALL')  # type: ignore
-            seen_uids = set(initial_messages) if initial_messages else set()
+            # Only the highest UID seen so far is tracked. UIDs are assigned in ascending
+            # order, so anything above it is new.
+            last_uid = folder_info[b'UIDNEXT'] - 1
             
-            logger.info(f"Listening for new emails... (Current inbox count: {len(seen_uids)})")
+            logger.info("Listening for new emails... (Current inbox count: %s)", folder_info[b'EXISTS'])
             
             while True:
                 try:
@@ -438,42 +683,45 @@ async def monitor_mailbox(hook: Hook | AsyncHook | None = None):
                     if responses:
                         # Filter for "EXISTS" responses (new mail)
                         if any(resp[1] == b'EXISTS' for resp in responses):
-                            # Fetch all current messages
-                            current_messages = client.search('ALL')  # type: ignore
+                            # Only ask the server for UIDs past the last one seen. "n:*" always
+                            # matches the highest UID, even when it is below n, so filter again.
+                            current_messages = client.search(['UID', f'{last_uid + 1}:*'])  # type: ignore
                             
-                            # Find new UIDs
-                            new_uids = set(current_messages) - seen_uids
+                            # Find new UIDs. SEARCH returns them in ascending order, so keep
+                            # the server's order instead of sorting.
+                            new_uids = [uid for uid in current_messages if uid > last_uid]
                             
                             if new_uids:
-                                for uid in sorted(new_uids):
-                                    logger.info(f"New email received (UID: {uid})")
+                                for uid in new_uids:
+                                    logger.info("New email received (UID: %s)", uid)
                                     
                                     # Fetch the email details
                                     email_obj = Email.get(client, uid)
                                     
                                     if email_obj:
-                                        logger.info(f"  From: {email_obj.sender}")
-                                        logger.info(f"  Subject: {email_obj.subject}")
-                                        logger.info(f"  Date: {email_obj.date}")
-                                        logger.info(f"  Body preview: {email_obj.body[:100]}...")
+                                        if logger.isEnabledFor(logging.INFO):
+                                            logger.info("  From: %s", email_obj.sender)
+                                            logger.info("  Subject: %s", email_obj.subject)
+                                            logger.info("  Date: %s", email_obj.date)
+                                            logger.info("  Body preview: %s...", email_obj.body_preview(100))
                                         
                                         # Call the hook if provided
                                         # Note: Hook is called from thread, so async hooks need special handling
                                         if hook:
                                             if asyncio.iscoroutinefunction(hook):
                                                 # Schedule coroutine in main event loop
-                                                asyncio.run_coroutine_threadsafe(hook(email_obj), asyncio.get_event_loop())
+                                                asyncio.run_coroutine_threadsafe(hook(email_obj), loop)
                                             else:
                                                 hook(email_obj)
                                     
                                     # Mark as seen
-                                    seen_uids.add(uid)
+                                    last_uid = max(last_uid, uid)
                 except Exception as e:
-                    logger.error(f"Error monitoring mailbox: {e}")
-                    import time
+                    logger.error("Error monitoring mailbox: %s", e)
                     time.sleep(5)  # Wait before retrying
     
-    # Run the blocking monitor in a separate thread
+    # Run the blocking monitor in a separate thread. It never returns, so keep it
+    # off the shared IMAP pool.
     await asyncio.to_thread(_monitor_sync)
 
 if __name__ == "__main__":
@@ -4,8 +4,16 @@ from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 import asyncio
-from functools import partial
+from dataclasses import asdict, dataclass
+from functools import lru_cache, partial
+import time
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+except ImportError:  # without rapidfuzz, fall back to the server-side searchContacts
+    process = None
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +23,12 @@ SCOPES = [
     "https://www.googleapis.com/auth/contacts",
 ]
 
+PERSON_FIELDS = "names,emailAddresses,phoneNumbers"
+# the full address book is pulled once and matched locally until it goes stale
+CONTACT_CACHE_TTL = 5 * 60
+MIN_MATCH_SCORE = 60
+_contact_cache: tuple[float, list["Contact"], list[str]] | None = None
+
 async def run_blocking(func, *args, **kwargs):
     loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
@@ -22,27 +36,15 @@ async def run_blocking(func, *args, **kwargs):
         partial(func, *args, **kwargs)
     )
 
+@dataclass(slots=True)
 class Contact:
-    def __init__(
-        self, 
-        name: str,
-        uid: int,
-        email: str | None = None, 
-        phone: str | None = None
-    ):
-        self.name = name
-        self.email = email
-        self.phone = phone
-        self.uid = uid
-    
+    name: str
+    uid: int
+    email: str | None = None
+    phone: str | None = None
     
     def serialize(self) -> dict:
-        return {
-            "name": self.name,
-            "email": self.email,
-            "phone": self.phone,
-            "uid": self.uid
-        }
+        return asdict(self)
     
     def __repr__(self):
         return f"Contact(name={self.name}, email={self.email}, phone={self.phone}, uid={self.uid})"
@@ -60,20 +62,81 @@ class Contact:
             phone = person["phoneNumbers"][0].get("value")
         uid = person.get("resourceName", "").split("/")[-1]
         return Contact(name=name or "Not Available", email=email, phone=phone, uid=uid)
-    
+
+
+def _execute(request):
+    try:
+        return request.execute()
+    except HttpError as e:
+        if e.resp.status == 401:
+            logger.warning("People API rejected the cached credentials, invalidating them.")
+            invalidate_people_service()
+        raise
+
+def _list_all_contacts(service) -> list[Contact]:
+    contacts = []
+    page_token = None
+    while True:
+        results = _execute(service.people().connections().list(
+            resourceName="people/me",
+            pageSize=1000,
+            personFields=PERSON_FIELDS,
+            pageToken=page_token,
+        ))
+        for person in results.get("connections", []):
+            contacts.append(Contact.from_google_person(person))
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            return contacts
+
+
+def _cached_contacts(service) -> tuple[list[Contact], list[str]]:
+    """All contacts, plus the string each one is matched on, refreshed every CONTACT_CACHE_TTL."""
+    global _contact_cache
+    now = time.monotonic()
+    if _contact_cache is None or now - _contact_cache[0] > CONTACT_CACHE_TTL:
+        contacts = _list_all_contacts(service)
+        choices = [
+            " ".join(filter(None, (contact.name, contact.email, contact.phone)))
+            for contact in contacts
+        ]
+        _contact_cache = (now, contacts, choices)
+        logger.info(f"Cached {len(contacts)} contacts for local search.")
+    return _contact_cache[1], _contact_cache[2]
+
+
+def invalidate_contact_cache() -> None:
+    global _contact_cache
+    _contact_cache = None
+
+
 async def fuzzy_search_contacts(service, query: str, page_size: int = 10) -> list[Contact]:
+    def _search_local():
+        contacts, choices = _cached_contacts(service)
+        matches = process.extract(  # type: ignore
+            query,
+            choices,
+            scorer=fuzz.WRatio,
+            processor=fuzz_utils.default_process,
+            limit=page_size,
+            score_cutoff=MIN_MATCH_SCORE,
+        )
+        return [contacts[index] for _, _, index in matches]
+
     def _search():
-        results = service.people().searchContacts(
+        results = _execute(service.people().searchContacts(
             query=query,
-            readMask="names,emailAddresses,phoneNumbers"
-        ).execute()
+            readMask=PERSON_FIELDS
+        ))
 
         contacts = []
         for person in results.get("results", []):
             contacts.append(Contact.from_google_person(person["person"]))
         return contacts
 
-    return await run_blocking(_search)
+    if process is None:
+        return await run_blocking(_search)
+    return await run_blocking(_search_local)
 
 async def create_people_contact(
     service,
@@ -90,17 +153,35 @@ async def create_people_contact(
         if phone:
             body["phoneNumbers"] = [{"value": phone}]
 
-        person = service.people().createContact(body=body).execute()
+        person = _execute(service.people().createContact(body=body))
+        invalidate_contact_cache()
         return Contact.from_google_person(person)
 
     return await run_blocking(_create)
 
 
+@lru_cache(maxsize=1)
 def get_people_service(creds: Credentials):
+    # building the client loads and parses the discovery document, so keep it around
     return build("people", "v1", credentials=creds, cache_discovery=False)
 
 
-def authenticate_people_api() -> Credentials:
+def invalidate_people_service() -> None:
+    """Drop the cached credentials and client, forcing the next call to re-authenticate."""
+    _load_credentials.cache_clear()
+    get_people_service.cache_clear()
+
+
+def _save_credentials(creds: Credentials) -> None:
+    cache_path = Config.cache_path() / "people_api"
+    cache_path.mkdir(parents=True, exist_ok=True)
+    with open(cache_path / "token.json", "w+") as token_file:
+        token_file.write(creds.to_json())
+        logger.info("Saved new People API token to cache.")
+
+
+@lru_cache(maxsize=1)
+def _load_credentials() -> Credentials:
     cache_path = Config.cache_path() / "people_api"
     creds = None
     if (cache_path / "token.json").exists():
@@ -119,10 +200,17 @@ def authenticate_people_api() -> Credentials:
             )
             print("Please complete the authentication flow at 10.8.0.1:8099 in your browser.")
             creds = flow.run_local_server(host="127.0.0.1", port=8099, open_browser=True)
-        cache_path.mkdir(parents=True, exist_ok=True)
-        with open(cache_path / "token.json", "w+") as token_file:
-            token_file.write(creds.to_json())
-            logger.info("Saved new People API token to cache.")
+        _save_credentials(creds)
+    return creds
+
+
+def authenticate_people_api() -> Credentials:
+    # token.json is only read once per process; afterwards just refresh when expired
+    creds = _load_credentials()
+    if creds.expired and creds.refresh_token:
+        logger.info("People API token expired, refreshing...")
+        creds.refresh(Request())
+        _save_credentials(creds)
     return creds
 
 async def main():
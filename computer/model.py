@@ -1,8 +1,7 @@
 import asyncio
-import copy
-from json import loads
+import functools
 import logging
-from openai import OpenAI, APIError, APIConnectionError, APITimeoutError
+from openai import AsyncOpenAI, APIError, APIConnectionError, APITimeoutError
 from pydantic import BaseModel
 from computer.config import Config
 from typing import Any, Awaitable, Callable, Dict, Tuple
@@ -13,6 +12,25 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# One connection pool shared by every Computer (including replicas), so completions
+# reuse keep-alive connections instead of paying a TCP+TLS handshake per request.
+_HTTP = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_keepalive_connections=Config.get_http_max_keepalive_connections(),
+        max_connections=Config.get_http_max_connections(),
+        keepalive_expiry=Config.get_http_keepalive_expiry(),
+    ),
+)
+
+# tool call arguments above this many characters are parsed in a worker thread
+LARGE_TOOL_ARGUMENTS = 64 * 1024
+
+# fraction of the context window the history may fill before it is pruned
+PRUNE_THRESHOLD = 0.8
+# fraction it is pruned down to. pruning well below the threshold in one go keeps the
+# prompt prefix unchanged for many cycles, so the server's prefix cache keeps hitting
+PRUNE_TARGET = 0.5
+
 type CycleHook = Callable[[
     str,                    # delta
     str,                    # content up to now  
@@ -27,6 +45,15 @@ type ApprovalHook = Callable[[
     float                   # timeout in seconds
 ], Awaitable[bool]]         # returns True if approved, False if denied
 
+def _result_length(result: Any) -> int:
+    # only strings are measured, stringifying an arbitrary result just to log its size is not worth it
+    return len(result) if isinstance(result, str) else -1
+
+@functools.lru_cache(maxsize=8)
+def _index_tools(tools: tuple[Tool, ...]) -> tuple[list[dict], dict[str, Tool]]:
+    """Schemas and name lookup for a tool set, shared by every Computer built from it."""
+    return [tool.openai_tool for tool in tools], {tool.name: tool for tool in tools}
+
 class Computer:
     def __init__(
         self, 
@@ -38,20 +65,20 @@ class Computer:
         approval_hook: ApprovalHook | None = None,
     ):
         logger.info(f"Initializing Computer with {len(tools)} tools, max_cycles={max_cycles}, timeout={timeout}s")
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             base_url=Config.get_endpoint(),
             api_key=Config.get_api_key(),
             timeout=timeout,
+            http_client=_HTTP,
         )
         self.model = Config.get_model()
         logger.info(f"Using model: {self.model} at endpoint: {Config.get_endpoint()}")
         
-        self.root_conversation = copy.deepcopy(conversation) if conversation else Conversation()
+        self.root_conversation = conversation.clone() if conversation else Conversation()
         self.conversation = conversation or Conversation()
         self.timeout = timeout
         self.tools = tools
-        self.tool_schemas = [tool.openai_tool for tool in tools]
-        self.tools_by_name = {tool.name: tool for tool in tools}
+        self.tool_schemas, self.tools_by_name = _index_tools(tuple(tools))
         self.temperature = temperature
         self.approval_hook = approval_hook
         
@@ -64,7 +91,7 @@ class Computer:
             tools=self.tools,
             max_cycles=self.max_cycles,
             timeout=self.timeout,
-            conversation=copy.deepcopy(self.root_conversation),
+            conversation=self.root_conversation.clone(),
             approval_hook=self.approval_hook,
         )
     
@@ -74,14 +101,19 @@ class Computer:
     
     async def handle_tools(self, tool_calls: dict[int, dict]) -> dict[int, dict]:
         logger.info(f"Handling {len(tool_calls)} tool call(s)")
-        results = {}
-        for index, call in tool_calls.items():
-            tool_name = call.get("name", "unknown")
+        
+        async def _execute(call: dict) -> str:
+            tool_name = call["function"].get("name", "unknown")
             logger.debug(f"Executing tool: {tool_name}")
-            result = await execute_tool_call(call, self.tools_by_name, self.approval_hook)
-            results[index] = {"result": result}
-            logger.debug(f"Tool {tool_name} completed with result length: {len(str(result))}")
-        return results
+            result = await execute_tool_call(call, self.tools_by_name, self.approval_hook, self.conversation)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Tool {tool_name} completed with result length: {_result_length(result)}")
+            return result
+        
+        # independent calls run concurrently; results keep their call index
+        indices = list(tool_calls.keys())
+        results = await asyncio.gather(*(_execute(tool_calls[index]) for index in indices))
+        return {index: {"result": result} for index, result in zip(indices, results)}
 
     @property
     def history(self) -> list[dict]:
@@ -102,108 +134,120 @@ class Computer:
         # conversation_branch: int = -1, # we can work with only up to ith message in conversation. non inclusive index
         # conversation_merge: int = -1,  # the context merges back at this message index. inclusive index
     ) -> None:
-            
-        if depth >= self.max_cycles:
-            logger.warning(f"Maximum recursion depth ({self.max_cycles}) reached at depth {depth}")
-            error_msg = f"Maximum recursion depth ({self.max_cycles}) reached. Stopping to prevent infinite loop."
-            await hook("", error_msg, {}, True, True, True)
-            return
         
-        if self.abort_signal:
-            self.abort_signal = False
-            if depth > 0: # if the abortion is true but level is 0, then the abortion came when there was no cycle running
-                logger.info("Cycle aborted by abort signal")
-                error_msg = "Agent loop aborted by user."
-                self.conversation.add_message("system", "Your work was paused by the user. Continue if the user wants.")
-                await hook("", error_msg, {}, True, True, True)
-                return
-        # if conversation_branch >= 0 and conversation_merge >= 0:
-        #     if conversation_branch >= conversation_merge:
-        #         logger.error("Invalid conversation branch/merge indices")
-        #         error_msg = "Invalid conversation branch/merge indices. Stopping cycle."
-        #         await hook("", error_msg, {}, True, True, True)
-        #         return
+        # one model call per pass; passes repeat while the model keeps calling tools
+        while depth < self.max_cycles:
+            if self.abort_signal:
+                self.abort_signal = False
+                if depth > 0: # if the abortion is true but level is 0, then the abortion came when there was no cycle running
+                    logger.info("Cycle aborted by abort signal")
+                    error_msg = "Agent loop aborted by user."
+                    self.conversation.add_message("system", "Your work was paused by the user. Continue if the user wants.")
+                    await hook("", error_msg, {}, True, True, True)
+                    return
+            # if conversation_branch >= 0 and conversation_merge >= 0:
+            #     if conversation_branch >= conversation_merge:
+            #         logger.error("Invalid conversation branch/merge indices")
+            #         error_msg = "Invalid conversation branch/merge indices. Stopping cycle."
+            #         await hook("", error_msg, {}, True, True, True)
+            #         return
         
-        if prompt:
-            logger.debug(f"Starting cycle at depth {depth} with prompt: {prompt[:100]}...")
-            self.conversation.add_message("user", prompt)
-            # if conversation_branch >= 0:
-            #     # because we add the new message, we are responsible for including it
-            #     conversation_branch += 1
-        else:
-            logger.debug(f"Continuing cycle at depth {depth} (tool response processing)")
+            if prompt:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Starting cycle at depth {depth} with prompt: {prompt[:100]}...")
+                self.conversation.add_message("user", prompt)
+                # if conversation_branch >= 0:
+                #     # because we add the new message, we are responsible for including it
+                #     conversation_branch += 1
+            else:
+                logger.debug(f"Continuing cycle at depth {depth} (tool response processing)")
         
-        try:
-            logger.debug(f"Creating chat completion stream for model {self.model}")
-            history = self.history
-            # print(history)
-            # if conversation_branch >= 0:
-            #     history = history[:conversation_branch]
-            # if conversation_merge >= 0:
-            #     history += self.conversation.history[conversation_merge:]
-            stream = await self.call_model(
-                model=self.model,
-                messages=history, # type: ignore
-                stream=True,
-                tools=self.tool_schemas, # type: ignore
-                temperature=self.temperature,
-            ) # type: ignore
+            context_window = Config.get_context_window()
+            if context_window:
+                freed = self.conversation.prune(
+                    int(PRUNE_THRESHOLD * context_window),
+                    int(PRUNE_TARGET * context_window),
+                )
+                if freed:
+                    logger.info(f"Pruned roughly {freed} tokens from the conversation")
+        
+            try:
+                logger.debug(f"Creating chat completion stream for model {self.model}")
+                history = self.history
+                # print(history)
+                # if conversation_branch >= 0:
+                #     history = history[:conversation_branch]
+                # if conversation_merge >= 0:
+                #     history += self.conversation.history[conversation_merge:]
+                stream = await self.call_model(
+                    model=self.model,
+                    messages=history, # type: ignore
+                    stream=True,
+                    tools=self.tool_schemas, # type: ignore
+                    temperature=self.temperature,
+                ) # type: ignore
             
-            # Process the incoming stream and collect the final assistant text and any tool calls
-            logger.debug("Processing response stream")
-            response_content, full_tool_calls = await process_stream(stream, hook)
-            logger.debug(f"Stream processed: content_length={len(response_content)}, tool_calls={len(full_tool_calls)}")
-        except (APIConnectionError, APITimeoutError, httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout) as e:
-            logger.error(f"Network error during API call: {str(e)}")
-            error_msg = f"Network error: {str(e)}\nStopping cycle."
-            await hook("", error_msg, {}, True, True, True)
-            return
-        except APIError as e:
-            logger.error(f"API error during call: {str(e)}")
-            error_msg = f"API error: {str(e)}\nStopping cycle."
-            await hook("", error_msg, {}, True, True, True)
-            return
-        except Exception as e:
-            logger.exception(f"Unexpected error during cycle: {str(e)}")
-            error_msg = f"Unexpected error: {str(e)}\nStopping cycle."
-            await hook("", error_msg, {}, True, True, True)
-            return
+                # Process the incoming stream and collect the final assistant text and any tool calls
+                logger.debug("Processing response stream")
+                response_content, full_tool_calls = await process_stream(stream, hook)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Stream processed: content_length={len(response_content)}, tool_calls={len(full_tool_calls)}")
+            except (APIConnectionError, APITimeoutError, httpx.TimeoutException, httpx.ConnectError, httpx.ReadTimeout) as e:
+                logger.error(f"Network error during API call: {str(e)}")
+                error_msg = f"Network error: {str(e)}\nStopping cycle."
+                await hook("", error_msg, {}, True, True, True)
+                return
+            except APIError as e:
+                logger.error(f"API error during call: {str(e)}")
+                error_msg = f"API error: {str(e)}\nStopping cycle."
+                await hook("", error_msg, {}, True, True, True)
+                return
+            except Exception as e:
+                logger.exception(f"Unexpected error during cycle: {str(e)}")
+                error_msg = f"Unexpected error: {str(e)}\nStopping cycle."
+                await hook("", error_msg, {}, True, True, True)
+                return
         
-        self.handle_assistant_msg(response_content, full_tool_calls)
+            self.handle_assistant_msg(response_content, full_tool_calls)
         
-        if full_tool_calls:
-            print(full_tool_calls)
-            if not tools_enabled:
-                logger.warning("Tool calls received but tools are disabled. Skipping execution.")
-                self.conversation.add_message(
-                    "system",
-                    "Tool execution is currently disabled."
-                )
-            else:
-                tool_results: dict[int, dict] = await self.handle_tools(full_tool_calls)
-                for idx, tool_result in tool_results.items():
+            if full_tool_calls:
+                print(full_tool_calls)
+                if not tools_enabled:
+                    logger.warning("Tool calls received but tools are disabled. Skipping execution.")
                     self.conversation.add_message(
-                        "tool",
-                        str(tool_result["result"]),
-                        tool_call_id=full_tool_calls[idx]["id"],
+                        "system",
+                        "Tool execution is currently disabled."
                     )
+                else:
+                    tool_results: dict[int, dict] = await self.handle_tools(full_tool_calls)
+                    for idx, tool_result in tool_results.items():
+                        self.conversation.add_message(
+                            "tool",
+                            str(tool_result["result"]),
+                            tool_call_id=full_tool_calls[idx]["id"],
+                        )
         
-        cycle_again = full_tool_calls != {}
-        await hook(
-            "", 
-            response_content, 
-            full_tool_calls, 
-            True,
-            not cycle_again,
-            False
-        )
-        if cycle_again:
+            cycle_again = full_tool_calls != {}
+            await hook(
+                "", 
+                response_content, 
+                full_tool_calls, 
+                True,
+                not cycle_again,
+                False
+            )
+            if not cycle_again:
+                return
             # if conversation_branch >= 0:
             #     # we need to set a merge if it does not exist
             #     if conversation_merge < 0:
             #         conversation_merge = len(self.conversation.history) - 1
-                
-            await self.cycle(None, hook, depth + 1, tools_enabled)
+            prompt = None
+            depth += 1
+        
+        logger.warning(f"Maximum recursion depth ({self.max_cycles}) reached at depth {depth}")
+        error_msg = f"Maximum recursion depth ({self.max_cycles}) reached. Stopping to prevent infinite loop."
+        await hook("", error_msg, {}, True, True, True)
     
     
     def handle_assistant_msg(self, response_content: str, full_tool_calls: Dict[int, dict]):
@@ -211,11 +255,15 @@ class Computer:
         """
         tool_calls = None
         if full_tool_calls:
+            # calls are already stored in the API layout, only the argument fragments need joining
             tool_calls = [
                 {
                     "id": tc["id"],
                     "type": "function",
-                    "function": {"name": tc["name"], "arguments": tc["arguments"]},
+                    "function": {
+                        "name": tc["function"]["name"],
+                        "arguments": "".join(tc["function"]["arguments_chunks"]),
+                    },
                 }
                 for tc in full_tool_calls.values()
             ]
@@ -226,11 +274,7 @@ class Computer:
         )
     
     async def call_model(self, *args, **kwargs):
-        return await asyncio.to_thread(
-            self.client.chat.completions.create,
-            *args,
-            **kwargs,
-        )
+        return await self.client.chat.completions.create(*args, **kwargs)
     
     def __repr__(self) -> str:
         return f"<Computer model={self.model} tools={len(self.tools)} history_msgs={len(self.conversation)}>"
@@ -240,18 +284,19 @@ async def process_stream(stream: Any, hook: CycleHook) -> Tuple[str, Dict[int, d
     """Consume a streaming chat response and collect full assistant text and tool calls.
 
     Args:
-        stream: An iterable/iterator of streaming chunks from the client.
+        stream: An async iterator of streaming chunks from the client.
         hook: A callback hook called with (new_content, full_content, done).
 
     Returns:
         A tuple (response_content, full_tool_calls) where response_content is the
         accumulated assistant text and full_tool_calls is a dict mapping tool-call
-        indices to reconstructed call info (id, name, arguments).
+        indices to reconstructed calls in the API layout, with the arguments
+        kept as a list of fragments in function.arguments_chunks.
     """
     response_content = ""
     full_tool_calls: Dict[int, dict] = {}
 
-    for chunk in stream:
+    async for chunk in stream:
         # preserve original structure: chunks have choices[0].delta
         delta = chunk.choices[0].delta
 
@@ -269,34 +314,45 @@ async def process_stream(stream: Any, hook: CycleHook) -> Tuple[str, Dict[int, d
                 if index not in full_tool_calls:
                     full_tool_calls[index] = {
                         "id": tc_delta.id,
-                        "name": tc_delta.function.name,
-                        "arguments": "",
+                        "type": "function",
+                        "function": {
+                            "name": tc_delta.function.name,
+                            # fragments are joined once the call is complete
+                            "arguments_chunks": [],
+                        },
                     }
 
                 args = getattr(tc_delta.function, "arguments", None)
                 if args:
-                    full_tool_calls[index]["arguments"] += args
+                    full_tool_calls[index]["function"]["arguments_chunks"].append(args)
     return response_content, full_tool_calls
 
 async def execute_tool_call(
     tool_call: dict,
     tools_by_name: Dict[str, Tool],
-    approval_hook: ApprovalHook | None
+    approval_hook: ApprovalHook | None,
+    conversation: Conversation | None = None,
 ) -> str:
     """Parse and execute a tool call, returning the result or error message.
     
     Args:
-        tool_call: Dict containing 'name' and 'arguments' (JSON string)
+        tool_call: Dict with 'function' holding 'name' and 'arguments_chunks' (JSON string fragments)
         tools_by_name: Mapping of tool names to Tool instances
         approval_hook: Approval hook for user confirmation
+        conversation: The conversation the call belongs to, for tools that act on it
         
     Returns:
         The tool execution result as a string, or an error message.
     """
-    tool_name = tool_call.get("name", "unknown")
+    tool_name = tool_call["function"].get("name", "unknown")
     logger.info(f"Executing tool call: {tool_name}")
     
-    tool, tool_input, error = parse_tool_call(tool_call, tools_by_name)
+    # big payloads are parsed off the event loop so other agents keep running
+    arguments_size = sum(map(len, tool_call["function"].get("arguments_chunks", ())))
+    if arguments_size > LARGE_TOOL_ARGUMENTS:
+        tool, tool_input, error = await asyncio.to_thread(parse_tool_call, tool_call, tools_by_name)
+    else:
+        tool, tool_input, error = parse_tool_call(tool_call, tools_by_name)
     
     if error:
         logger.error(f"Tool call parse error for {tool_name}: {error}")
@@ -304,9 +360,11 @@ async def execute_tool_call(
     
     try:
         assert tool is not None and tool_input is not None
-        logger.debug(f"Tool {tool_name} input: {tool_input}")
-        result = await tool.execute(tool_input, approval_hook)
-        logger.info(f"Tool {tool_name} executed successfully, result length: {len(str(result))}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tool {tool_name} input: {tool_input}")
+        result = await tool.execute(tool_input, approval_hook, conversation)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Tool {tool_name} executed successfully, result length: {_result_length(result)}")
         return result
     except Exception as e:
         logger.exception(f"Error executing tool {tool_name}: {str(e)}")
@@ -4,9 +4,13 @@ import os
 from pathlib import Path
 import logging
 from typing import Optional
+import yaml
 
 logger = logging.getLogger(__name__) 
 
+# parsed skills, reused until the skills directory changes
+_SKILLS_CACHE: tuple[tuple, list["Skill"]] | None = None
+
 class Skill:
     
     def __init__(self, name: str, description: str, metadata: dict, path: Path):
@@ -22,7 +26,6 @@ class Skill:
             return None
         
         with open(path / "SKILL.md", "r") as f:
-            # parse header
             # expected format:
             # ---
             # name: Skill Name
@@ -30,35 +33,58 @@ class Skill:
             # any_other_metadata: value
             # ---
             # body
-            lines = f.read().splitlines()
-            if lines[0].strip() != "---":
-                return None
-            metadata = {}
-            i = 1
-            while i < len(lines) and lines[i].strip() != "---":
-                line = lines[i].strip()
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    metadata[key.strip()] = value.strip()
-                else:
-                    # invalid metadata line
-                    return None
-                i += 1
-            if i >= len(lines):
+            # only the frontmatter is read, the body is never loaded
+            if f.readline().strip() != "---":
                 return None
-            name = metadata.pop("name", None)
-            description = metadata.pop("description", None)
-            if not name or not description:
+            header = []
+            for line in f:
+                if line.strip() == "---":
+                    break
+                header.append(line)
+            else:
                 return None
-        return Skill(name, description, metadata, path)
-                
+        metadata = _parse_header(header)
+        if metadata is None:
+            return None
+        name = metadata.pop("name", None)
+        description = metadata.pop("description", None)
+        if not name or not description:
+            return None
+        return Skill(str(name), str(description), metadata, path)
+
+
+def _parse_header(lines: list[str]) -> Optional[dict]:
+    """Plain `key: value` lines keep their values as strings; YAML is only used for multi-line values."""
+    metadata = {}
+    for line in lines:
+        if ":" not in line or line[:1].isspace():
+            break
+        key, value = line.split(":", 1)
+        metadata[key.strip()] = value.strip()
+    else:
+        return metadata
+    try:
+        metadata = yaml.safe_load("".join(lines))
+    except yaml.YAMLError:
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+def _skills_stamp(skills_root: Path) -> tuple:
+    """Changes whenever a skill directory is added/removed or any SKILL.md is edited."""
+    mtimes = [skills_root.stat().st_mtime]
+    mtimes.extend(skill_md.stat().st_mtime for skill_md in skills_root.glob("*/SKILL.md"))
+    return str(skills_root.resolve()), len(mtimes), max(mtimes)
 
 def load_skills() -> list[Skill]:
+    global _SKILLS_CACHE
     skills_root = Path(os.environ.get("SKILLS_PATH", "skills"))
     skills = []
     if not skills_root.exists():
         logger.info(f"Skills directory {skills_root} does not exist.")
         return skills
+    stamp = _skills_stamp(skills_root)
+    if _SKILLS_CACHE is not None and _SKILLS_CACHE[0] == stamp:
+        return list(_SKILLS_CACHE[1])
     for item in skills_root.iterdir():
         if item.is_dir():
             skill = Skill.load_skill(item)
@@ -66,7 +92,8 @@ def load_skills() -> list[Skill]:
                 skills.append(skill)
             else:
                 logger.warning(f"Failed to load skill from {item}")
-    return skills
+    _SKILLS_CACHE = (stamp, skills)
+    return list(skills)
 
 def load_skill_by_name(name: str) -> Optional[Skill]:
     skills = load_skills()
@@ -1,5 +1,5 @@
-import json
 from datetime import datetime, timezone
+from computer._json import dumps
 from computer.gmail.client import get_unread_emails
 from computer.tasks.task import TaskParams, task
 
@@ -21,4 +21,4 @@ async def run_email_check(_input: EmailTask) -> str:
         "count": len(unread_emails),
         "emails": [x.serialize() for x in unread_emails]
     }
-    return json.dumps(message)
\ No newline at end of file
+    return dumps(message)
\ No newline at end of file
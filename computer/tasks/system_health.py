@@ -1,10 +1,16 @@
 import asyncio
-import subprocess
+import shlex
 from anyio import Path
 from computer.model import Computer
 from computer.skills import load_skill_by_name
 from computer.tasks.task import TaskParams, task
-from computer.tools.system import ExecuteCommand
+
+HEALTH_CHECK_TIMEOUT = 120
+
+# long-lived bash that runs the health scripts, so a check doesn't spawn a fresh shell every time
+_BASH: asyncio.subprocess.Process | None = None
+_BASH_LOCK = asyncio.Lock()
+_DONE = "__DONE__:"
 
 class SystemHealthTask(TaskParams):
     """
@@ -15,34 +21,57 @@ class SystemHealthTask(TaskParams):
         # every day at 7 am, and at 7 pm
         return "0 7,19 * * *"
 
+async def _read_until_done(process: asyncio.subprocess.Process) -> tuple[int, str]:
+    assert process.stdout is not None
+    lines = []
+    while True:
+        line = await process.stdout.readline()
+        if not line:
+            raise RuntimeError("bash worker exited unexpectedly")
+        text = line.decode()
+        if text.startswith(_DONE):
+            return int(text[len(_DONE):]), "".join(lines).strip()
+        lines.append(text)
+
+async def run_script(script_path, timeout: float) -> tuple[int, str]:
+    """Run a script in the shared bash worker, returning its exit code and combined output."""
+    global _BASH
+    async with _BASH_LOCK:
+        if _BASH is None or _BASH.returncode is not None:
+            _BASH = await asyncio.create_subprocess_exec(
+                "bash",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
+        assert _BASH.stdin is not None
+        # the script must not read the worker's stdin; the sentinel goes on its own line
+        _BASH.stdin.write(
+            f"bash {shlex.quote(str(script_path))} </dev/null 2>&1; printf '\\n{_DONE}%s\\n' $?\n".encode()
+        )
+        await _BASH.stdin.drain()
+        try:
+            return await asyncio.wait_for(_read_until_done(_BASH), timeout=timeout)
+        except BaseException:
+            # output is out of sync with the sentinel now, start over with a fresh worker
+            _BASH.kill()
+            await _BASH.wait()
+            _BASH = None
+            raise
+
 @task(SystemHealthTask)
 async def run_health_check(_input: SystemHealthTask):
     health_skill = load_skill_by_name("health-check")
     if not health_skill:
         return "Health check skill not found."
     script_path = health_skill.path / "health_check.sh"
-    cmd = ExecuteCommand(
-        command=f"bash {script_path}",
-        timeout=120
-    )
     
     try:
-        process = await asyncio.create_subprocess_shell(
-            cmd.command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(),
-            timeout=cmd.timeout
-        )
-        
-        if process.returncode != 0:
-            return f"Error: {stderr.decode().strip()}"
-        return stdout.decode().strip()
+        returncode, output = await run_script(script_path, HEALTH_CHECK_TIMEOUT)
+        if returncode != 0:
+            return f"Error: {output}"
+        return output
     except asyncio.TimeoutError:
-        return f"Error: Command timed out after {cmd.timeout} seconds"
+        return f"Error: Command timed out after {HEALTH_CHECK_TIMEOUT} seconds"
     except Exception as e:
         return f"Error: {str(e)}"
-    return subprocess_result.stdout.strip()
\ No newline at end of file
@@ -23,7 +23,10 @@ class TaskParams(abc.ABC):
 def task[T: TaskParams](schema: type[T]):
     """Decorator that generates the registered function for a tool."""
     def decorator(func: Callable):
-        func.registered = lambda: Task(schema, func)  # type: ignore
+        # reflection happens once here rather than on every run
+        accepts_approval_hook = 'approval_hook' in inspect.signature(func).parameters
+        is_async = inspect.iscoroutinefunction(func)
+        func.registered = lambda: Task(schema, func, accepts_approval_hook, is_async)  # type: ignore
         return func
     return decorator
 
@@ -32,10 +35,18 @@ class Task[T: TaskParams]:
         self,
         schema: Type[T],
         function: Callable,
+        accepts_approval_hook: bool | None = None,
+        is_async: bool | None = None,
     ):
         self.schema: Type[T] = schema
         self.function = function
         self.name = schema.__name__
+        if accepts_approval_hook is None:
+            accepts_approval_hook = 'approval_hook' in inspect.signature(function).parameters
+        if is_async is None:
+            is_async = inspect.iscoroutinefunction(function)
+        self.accepts_approval_hook = accepts_approval_hook
+        self.is_async = is_async
     
     def description(self) -> str:
         """Returns the description of the task, which is the docstring of the function."""
@@ -43,18 +54,14 @@ class Task[T: TaskParams]:
     
     async def execute(self, input: T, approval_hook: "ApprovalHook | None" = None) -> str:
         fn = self.function
-        
-        # Check if function accepts approval_hook parameter
-        sig = inspect.signature(fn)
-        accepts_approval_hook = 'approval_hook' in sig.parameters
 
         # Build kwargs based on function signature
         kwargs = {}
-        if accepts_approval_hook:
+        if self.accepts_approval_hook:
             kwargs['approval_hook'] = approval_hook
 
         # Call the function with appropriate parameters
-        if inspect.iscoroutinefunction(fn):
+        if self.is_async:
             # Async function - await directly
             return await fn(input, **kwargs)
         else:
@@ -1,4 +1,5 @@
-import subprocess
+import asyncio
+import shlex
 from typing import Any
 from pydantic import BaseModel, Field
 
@@ -17,8 +18,8 @@ class AdminTooling(BaseModel):
     """
     command: str = Field(..., description="The admin command to execute.")
 
-@tool(AdminTooling)
-def execute_command(tool_input: AdminTooling) -> str:
+@tool(AdminTooling, exclusive=True)
+async def execute_command(tool_input: AdminTooling) -> str:
     """
     Execute the ExecuteCommand tool with the given input.
 
@@ -28,12 +29,16 @@ def execute_command(tool_input: AdminTooling) -> str:
     Returns:
         str: The result of the ExecuteCommand tool execution.
     """
-    subprocess_result = subprocess.run(
-        f"admin {tool_input.command}",
-        shell=True,
-        capture_output=True,
-        text=True
+    try:
+        argv = shlex.split(tool_input.command)
+    except ValueError as e:
+        return f"Error: Could not parse command: {e}"
+    process = await asyncio.create_subprocess_exec(
+        "admin", *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
-    if subprocess_result.returncode != 0:
-        return f"Error: {subprocess_result.stderr.strip()}"
-    return subprocess_result.stdout.strip()
\ No newline at end of file
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        return f"Error: {stderr.decode(errors='replace').strip()}"
+    return stdout.decode(errors="replace").strip()
\ No newline at end of file
@@ -1,14 +1,16 @@
-import json
 from pydantic import BaseModel, Field
 from typing import TYPE_CHECKING, Optional
 
-from computer.google.contacts import create_people_contact, fuzzy_search_contacts, get_people_service, authenticate_people_api
+from computer._json import dumps
+from computer.google.contacts import create_people_contact, fuzzy_search_contacts, get_people_service, authenticate_people_api, run_blocking
 from computer.tools.tool import tool
 
 if TYPE_CHECKING:
     from computer.model import ApprovalHook
 
-SERVICE = get_people_service(authenticate_people_api())
+def _service():
+    """People API client, built on first use instead of at import. Both calls are memoized, but may block on OAuth."""
+    return get_people_service(authenticate_people_api())
 
 class SearchContacts(BaseModel):
     """
@@ -26,8 +28,9 @@ class CreateContact(BaseModel):
 
 @tool(CreateContact)
 async def create_contact(command: CreateContact) -> str:
+    service = await run_blocking(_service)
     result = await create_people_contact(
-        SERVICE,
+        service,
         name=command.name,
         email=command.email,
         phone=command.phone
@@ -41,10 +44,11 @@ async def create_contact(command: CreateContact) -> str:
 async def search_contacts(command: SearchContacts) -> str:
     if command.query.strip() == "":
         return "Please provide a non-empty query to search for contacts."
-    contacts = await fuzzy_search_contacts(SERVICE, command.query)
+    service = await run_blocking(_service)
+    contacts = await fuzzy_search_contacts(service, command.query)
     results = {
         "count": len(contacts),
         "contacts": [contact.serialize() for contact in contacts]
     }
-    return json.dumps(results)
+    return dumps(results)
     
\ No newline at end of file
@@ -0,0 +1,29 @@
+from typing import TYPE_CHECKING
+from pydantic import BaseModel, Field
+
+from computer.config import Config
+from computer.tools.tool import tool
+
+if TYPE_CHECKING:
+    from computer.conversation import Conversation
+
+class PruneContext(BaseModel):
+    """
+    Free up room in the conversation. Old tool results are cleared first, then the oldest messages are removed.
+    Use when earlier tool output is no longer needed. Recent messages are always kept.
+    """
+    target_tokens: int | None = Field(
+        description="Approximate size to shrink the conversation to, in tokens. Defaults to half the context window.",
+        default=None
+    )
+
+@tool(PruneContext)
+async def prune_context(input: PruneContext, conversation: "Conversation | None" = None) -> str:
+    if conversation is None:
+        return "Error: No conversation available to prune."
+    context_window = Config.get_context_window()
+    if not input.target_tokens and not context_window:
+        return "Error: No target_tokens given and CONTEXT_WINDOW is not configured."
+    target = input.target_tokens or context_window // 2
+    freed = conversation.prune(target)
+    return f"Pruned roughly {freed} tokens. The conversation is now about {conversation.token_count()} tokens."
@@ -1,21 +1,29 @@
 
 
 import asyncio
+from contextlib import aclosing
 from datetime import datetime, timedelta
-import json
 import subprocess
 import os
 from pydantic import BaseModel, Field
 from typing import TYPE_CHECKING, Optional
 
+from computer._json import dumps
 from computer.email.client import delete_email_imap, search_emails_imap, send_smtp
 from computer.tools.tool import tool
 
 if TYPE_CHECKING:
     from computer.model import ApprovalHook
 
-
-ONE_DAY_AGO = datetime.now() - timedelta(days=1)
+# shown to the user before anything is sent
+EMAIL_APPROVAL_TEMPLATE = (
+    "**Email Approval Request**\n\n"
+    "Subject: `{subject}`\n"
+    "To: {to}\n\n"
+    "Body: {body}\n\n"
+)
+EMAIL_DENIED = "User did not approve the email. Work with the user to refine."
+EMAIL_NO_APPROVAL = "Approval mechanism not available. Cannot send email without user confirmation."
 
 class SendEmail(BaseModel):
     """
@@ -42,8 +50,12 @@ class SearchEmails(BaseModel):
     subject: Optional[str] = Field(None, description="Filter emails by subject content.")
     body: Optional[str] = Field(None, description="Filter emails by body content.")
     unread_only: Optional[bool] = Field(None, description="Filter for only unread emails.")
-    since: Optional[str] = Field(ONE_DAY_AGO.strftime("%Y-%m-%d"), description="Filter for emails received since this date (YYYY-MM-DD).")
+    since: Optional[str] = Field(
+        default_factory=lambda: (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d"),
+        description="Filter for emails received since this date (YYYY-MM-DD). Defaults to yesterday."
+    )
     before: Optional[str] = Field(None, description="Filter for emails received before this date (YYYY-MM-DD).")
+    limit: int = Field(10, ge=1, le=50, description="Maximum number of emails to return. The most recent matches are returned.")
 
 @tool(SearchEmails)
 async def search_emails(command: SearchEmails) -> str:
@@ -54,20 +66,28 @@ async def search_emails(command: SearchEmails) -> str:
     if command.before:
         datetime_before = datetime.strptime(command.before, "%Y-%m-%d")
         
-    emails = await search_emails_imap(
+    emails = []
+    found = search_emails_imap(
         from_address=command.sender,
         subject=command.subject,
         body=command.body,
         unread_only=command.unread_only or False,
         since=datetime_from,
-        before=datetime_before
+        before=datetime_before,
+        batch_size=command.limit
     )
+    # stop pulling from the server as soon as enough emails have arrived
+    async with aclosing(found):
+        async for email in found:
+            emails.append(email.serialize())
+            if len(emails) >= command.limit:
+                break
     
     result = {
         "count": len(emails),
-        "emails": [email.serialize() for email in emails]
+        "emails": emails
     }
-    return json.dumps(result)
+    return dumps(result)
 
 @tool(DeleteEmail)
 async def delete_email(command: DeleteEmail) -> str:
@@ -82,21 +102,16 @@ async def delete_email(command: DeleteEmail) -> str:
 async def send_email(command: SendEmail, approval_hook: "ApprovalHook | None" = None) -> str:
     # Request approval from user
     if approval_hook:
-        approval_message = (
-            f"**Email Approval Request**\n\n"
-            f"Subject: `{command.subject}`\n"
-            f"To: {command.to}\n\n"
-            f"Body: {command.body}\n\n"
-        )
+        approval_message = EMAIL_APPROVAL_TEMPLATE.format(subject=command.subject, to=command.to, body=command.body)
         
         # Use 3 minute timeout (180 seconds) for approval
         approved = await approval_hook(approval_message, 180.0)
         
         if not approved:
-            return "User did not approve the email. Work with the user to refine."
+            return EMAIL_DENIED
     else:
         # Fallback: if no approval hook, deny by default for safety
-        return "Approval mechanism not available. Cannot send email without user confirmation."
+        return EMAIL_NO_APPROVAL
     
     sent = await send_smtp(
         to=command.to,
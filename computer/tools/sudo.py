@@ -1,8 +1,8 @@
 
 
 import asyncio
-import subprocess
 import os
+import shlex
 from pydantic import BaseModel, Field
 from typing import TYPE_CHECKING, Optional
 
@@ -11,6 +11,23 @@ from computer.tools.tool import tool
 if TYPE_CHECKING:
     from computer.model import ApprovalHook
 
+# approval prompts are fixed templates filled per call; the deny messages never change
+LINUX_APPROVAL_TEMPLATE = (
+    "**Sudo Command Approval Request (Linux)**\n\n"
+    "Command: `{command}`\n"
+    "Timeout: {timeout}s\n\n"
+    "This command requires sudo privileges."
+)
+WINDOWS_APPROVAL_TEMPLATE = (
+    "**Elevated Command Approval Request (Windows)**\n\n"
+    "Command: `{command}`\n"
+    "Timeout: {timeout}s\n\n"
+    "This command requires administrator privileges."
+)
+LINUX_DENIED = "Permission denied: User did not approve sudo command execution."
+LINUX_NO_APPROVAL = "Permission denied: Approval mechanism not available. Cannot execute sudo commands without user confirmation."
+WINDOWS_DENIED = "Permission denied: User did not approve elevated command execution."
+WINDOWS_NO_APPROVAL = "Permission denied: Approval mechanism not available. Cannot execute elevated commands without user confirmation."
 
 class ExecuteSudoCommand(BaseModel):
     """
@@ -24,76 +41,104 @@ class ExecuteSudoCommand(BaseModel):
         description="Timeout in seconds for command execution."
     )
 
-@tool(ExecuteSudoCommand, platform="linux")
-async def execute_sudo(command: ExecuteSudoCommand, approval_hook: "ApprovalHook | None" = None) -> str:
+def _askpass_fd(password: str) -> int:
+    """
+    An in-memory (memfd) askpass script that prints the password, for sudo -A.
+    Nothing is written to disk or piped through the command's stdin.
+    """
+    fd = os.memfd_create("sudo-askpass")
+    try:
+        os.write(fd, f"#!/bin/sh\nprintf '%s\\n' {shlex.quote(password)}\n".encode())
+        os.fchmod(fd, 0o500)
+    except BaseException:
+        os.close(fd)
+        raise
+    return fd
+
+@tool(ExecuteSudoCommand, platform="linux", exclusive=True)
+async def execute_sudo_linux(command: ExecuteSudoCommand, approval_hook: "ApprovalHook | None" = None) -> str:
     """Execute command with elevated privileges on Linux."""
     # Request approval from user
     if approval_hook:
-        approval_message = (
-            f"**Sudo Command Approval Request (Linux)**\n\n"
-            f"Command: `{command.command}`\n"
-            f"Timeout: {command.timeout}s\n\n"
-            f"This command requires sudo privileges."
-        )
+        approval_message = LINUX_APPROVAL_TEMPLATE.format(command=command.command, timeout=command.timeout)
         
         approved = await approval_hook(approval_message, 180.0)
         
         if not approved:
-            return "Permission denied: User did not approve sudo command execution."
+            return LINUX_DENIED
     else:
-        return "Permission denied: Approval mechanism not available. Cannot execute sudo commands without user confirmation."
+        return LINUX_NO_APPROVAL
     
     # Get sudo password from environment
     sudo_password = os.getenv("SUDO_PASSWORD")
     if not sudo_password:
         return "Error: SUDO_PASSWORD environment variable not set. Cannot execute sudo commands."
     
-    # Remove 'sudo' prefix if present since we'll add it back with -S
+    # Remove 'sudo' prefix if present since we'll add it back with -A or -S
     cmd = command.command
     if cmd.startswith("sudo "):
         cmd = cmd[5:].strip()  # Remove "sudo " prefix
     
-    # This avoids shell injection and keeps password out of shell history
-    process = subprocess.Popen(
-        ['sudo', '-S'] + cmd.split(),
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    try:
+        argv = shlex.split(cmd)
+    except ValueError as e:
+        return f"Error: Could not parse command: {e}"
     
+    # This avoids shell injection and keeps password out of shell history.
+    # sudo closes inherited descriptors before running the askpass helper, so it is
+    # reached through this process's fd table, which stays open until sudo exits.
+    # Without memfd (macOS) the password goes through stdin with sudo -S instead
+    askpass = _askpass_fd(sudo_password) if hasattr(os, "memfd_create") else None
     try:
-        stdout, stderr = await asyncio.to_thread(process.communicate, input=f"{sudo_password}\n", timeout=command.timeout)
+        if askpass is not None:
+            process = await asyncio.create_subprocess_exec(
+                'sudo', '-A', *argv,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, "SUDO_ASKPASS": f"/proc/{os.getpid()}/fd/{askpass}"},
+            )
+            password_input = None
+        else:
+            process = await asyncio.create_subprocess_exec(
+                'sudo', '-S', *argv,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            password_input = f"{sudo_password}\n".encode()
         
-        if process.returncode != 0:
-            # Clean up sudo password prompt from stderr if present
-            stderr_clean = stderr.replace("[sudo] password for ", "").strip()
-            return f"Error: {stderr_clean}"
-        
-        return stdout.strip()
-    except subprocess.TimeoutExpired:
-        process.kill()
-        return f"Error: Command timed out after {command.timeout} seconds"
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(input=password_input), timeout=command.timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return f"Error: Command timed out after {command.timeout} seconds"
+    finally:
+        if askpass is not None:
+            os.close(askpass)
+    
+    if process.returncode != 0:
+        # Clean up sudo password prompt from stderr if present
+        stderr_clean = stderr.decode(errors="replace").replace("[sudo] password for ", "").strip()
+        return f"Error: {stderr_clean}"
+    
+    return stdout.decode(errors="replace").strip()
 
 
-@tool(ExecuteSudoCommand, platform="windows")
-async def execute_sudo(command: ExecuteSudoCommand, approval_hook: "ApprovalHook | None" = None) -> str:
+@tool(ExecuteSudoCommand, platform="windows", exclusive=True)
+async def execute_sudo_windows(command: ExecuteSudoCommand, approval_hook: "ApprovalHook | None" = None) -> str:
     """Execute command with elevated privileges on Windows."""
     # Request approval from user
     if approval_hook:
-        approval_message = (
-            f"**Elevated Command Approval Request (Windows)**\n\n"
-            f"Command: `{command.command}`\n"
-            f"Timeout: {command.timeout}s\n\n"
-            f"This command requires administrator privileges."
-        )
+        approval_message = WINDOWS_APPROVAL_TEMPLATE.format(command=command.command, timeout=command.timeout)
         
         approved = await approval_hook(approval_message, 180.0)
         
         if not approved:
-            return "Permission denied: User did not approve elevated command execution."
+            return WINDOWS_DENIED
     else:
-        return "Permission denied: Approval mechanism not available. Cannot execute elevated commands without user confirmation."
+        return WINDOWS_NO_APPROVAL
     
     # Remove any 'sudo' prefix if present
     cmd = command.command
@@ -106,20 +151,20 @@ async def execute_sudo(command: ExecuteSudoCommand, approval_hook: "ApprovalHook
     # Use PowerShell to run as administrator
     ps_script = f'Start-Process powershell -Verb RunAs -ArgumentList "-NoProfile -ExecutionPolicy Bypass -Command \\"{cmd_escaped}; Write-Host \'\'; Write-Host \'Press any key to close...\' -NoNewline; $null = $Host.UI.RawUI.ReadKey(\'NoEcho,IncludeKeyDown\')\\"" -Wait'
     
-    process = subprocess.Popen(
-        ['powershell', '-NoProfile', '-Command', ps_script],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+    process = await asyncio.create_subprocess_exec(
+        'powershell', '-NoProfile', '-Command', ps_script,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
     )
     
     try:
-        stdout, stderr = await asyncio.to_thread(process.communicate, timeout=command.timeout)
-        
-        if process.returncode != 0:
-            return f"Error: Command failed with return code {process.returncode}\n{stderr.strip()}"
-        
-        return stdout.strip()
-    except subprocess.TimeoutExpired:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=command.timeout)
+    except asyncio.TimeoutError:
         process.kill()
+        await process.wait()
         return f"Error: Command timed out after {command.timeout} seconds"
+    
+    if process.returncode != 0:
+        return f"Error: Command failed with return code {process.returncode}\n{stderr.decode(errors='replace').strip()}"
+    
+    return stdout.decode(errors="replace").strip()
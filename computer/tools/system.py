@@ -1,9 +1,18 @@
+import asyncio
+import getpass
+import os
+import shlex
+import shutil
+import time
 from typing import Callable, Optional
 from pydantic import BaseModel, Field
-import subprocess
 
+from computer.config import Config
 from computer.tools.tool import Tool, tool
 
+# characters that need a shell to mean what they say: pipes, redirects, chaining, expansion, globbing, comments
+_SHELL_CHARS = frozenset("|&;<>()$`*?[]{}~#\n")
+
 class ExecuteCommand(BaseModel):
     """
     Execute a command in the (non-root) linux terminal environment.
@@ -17,8 +26,54 @@ class ExecuteCommand(BaseModel):
         description = "Timeout in seconds for command execution."
     )
 
+def _exec_argv(command: str, tokens: list[str] | None) -> list[str] | None:
+    """argv for running the command directly, or None if it has to go through a shell."""
+    if not tokens or any(c in _SHELL_CHARS for c in command):
+        return None
+    # env assignments and shell builtins (cd, export, ...) only work in a shell
+    if "=" in tokens[0] or shutil.which(tokens[0]) is None:
+        return None
+    return tokens
+
+# files larger than this are left to the real cat
+FAST_CAT_MAX_BYTES = 1024 * 1024
+
+def _ls(args: list[str]) -> str | None:
+    path = args[0] if args else "."
+    if len(args) > 1 or path.startswith("-") or not os.path.isdir(path):
+        return None
+    return "\n".join(sorted(name for name in os.listdir(path) if not name.startswith(".")))
+
+def _cat(args: list[str]) -> str | None:
+    if len(args) != 1 or args[0].startswith("-") or not os.path.isfile(args[0]):
+        return None
+    if os.path.getsize(args[0]) > FAST_CAT_MAX_BYTES:
+        return None
+    with open(args[0], "r", errors="replace") as f:
+        return f.read()
+
+# python equivalents of trivial read-only commands. each returns None when the arguments
+# are anything but the plain form, and the real command runs instead
+_FAST_COMMANDS: dict[str, Callable[[list[str]], str | None]] = {
+    "pwd": lambda args: None if args else os.getcwd(),
+    "whoami": lambda args: None if args else getpass.getuser(),
+    "date": lambda args: None if args else time.strftime("%a %b %e %H:%M:%S %Z %Y"),
+    "echo": lambda args: None if args and args[0].startswith("-") else " ".join(args),
+    "ls": _ls,
+    "cat": _cat,
+}
+
+def _run_fast(argv: list[str]) -> str | None:
+    handler = _FAST_COMMANDS.get(argv[0])
+    if handler is None:
+        return None
+    try:
+        return handler(argv[1:])
+    except OSError:
+        return None  # let the real command produce the error message
+
 @tool(ExecuteCommand)
-def execute_command(tool_input: ExecuteCommand) -> str:
+async def execute_command(tool_input: ExecuteCommand) -> str:
     """
     Execute the ExecuteCommand tool with the given input.
 
@@ -28,15 +83,38 @@ def execute_command(tool_input: ExecuteCommand) -> str:
     Returns:
         str: The result of the ExecuteCommand tool execution.
     """
-    if tool_input.command.strip().startswith("sudo "):
+    try:
+        tokens = shlex.split(tool_input.command)
+    except ValueError:
+        tokens = None  # unbalanced quotes, let the shell report it
+    if tokens and tokens[0] == "sudo":
         return "Error: 'sudo' commands are not allowed. Please use the ExecuteSudoCommand tool for commands requiring elevated privileges."
-    subprocess_result = subprocess.run(
-        tool_input.command,
-        shell=True,
-        capture_output=True,
-        text=True,
-        timeout=tool_input.timeout
-    )
-    if subprocess_result.returncode != 0:
-        return f"Error: {subprocess_result.stderr.strip()}"
-    return subprocess_result.stdout.strip()
\ No newline at end of file
+    argv = _exec_argv(tool_input.command, tokens)
+    if argv is not None and Config.get_fast_commands():
+        output = _run_fast(argv)
+        if output is not None:
+            return output.strip()
+    if argv is not None:
+        # plain commands are exec'd directly, skipping the intermediate /bin/sh
+        process = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    else:
+        process = await asyncio.create_subprocess_shell(
+            tool_input.command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=tool_input.timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return f"Error: Command timed out after {tool_input.timeout} seconds"
+    
+    if process.returncode != 0:
+        return f"Error: {stderr.decode(errors='replace').strip()}"
+    return stdout.decode(errors="replace").strip()
\ No newline at end of file
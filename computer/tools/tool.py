@@ -2,20 +2,35 @@
 
 import asyncio
 from collections.abc import Awaitable
+import functools
 import inspect
+import sys
 from typing import Callable, Literal, Optional, Type, TypeVar, TYPE_CHECKING, Union
 import openai
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
+    from computer.conversation import Conversation
     from computer.model import ApprovalHook
 
 T = TypeVar('T', bound=BaseModel)
 
-def tool(schema: type[T], platform: Optional[Literal["linux", "windows"]] = None):
-    """Decorator that generates the registered function for a tool."""
+# resolved once at import; tools for any other platform are never registered
+_CURRENT_PLATFORM = "windows" if sys.platform == "win32" else "linux"
+
+def tool(
+    schema: type[T],
+    platform: Optional[Literal["linux", "windows"]] = None,
+    exclusive: bool = False,
+):
+    """Decorator that generates the registered function for a tool.
+    Tools run concurrently unless exclusive is set, in which case calls are serialized.
+    A tool for another platform is left unregistered, so discovery never sees it.
+    """
     def decorator(func: Callable):
-        func.registered = lambda: Tool(schema, func, platform)  # type: ignore
+        if platform is not None and platform != _CURRENT_PLATFORM:
+            return func
+        func.registered = lambda: Tool(schema, func, platform, exclusive)  # type: ignore
         return func
     return decorator
 
@@ -25,27 +40,57 @@ class Tool[T: BaseModel]:
         schema: Type[T],
         function: Callable,
         platform: Optional[Literal["linux", "windows"]] = None,
+        exclusive: bool = False,
     ):
         self.schema = schema
         self.function = function
         self.platform = platform
-        self.openai_tool = openai.pydantic_function_tool(schema) 
+        self._lock = asyncio.Lock() if exclusive else None
         self.name = schema.__name__
+        # the model's compiled pydantic-core validator parses and validates raw JSON in one pass
+        self._validator = schema.__pydantic_validator__
+        # the function never changes after decoration, so reflect on it once
+        parameters = inspect.signature(function).parameters
+        self._accepts_hook = 'approval_hook' in parameters
+        self._accepts_conversation = 'conversation' in parameters
+        self._is_coro = inspect.iscoroutinefunction(function)
+    
+    def validate_json(self, arguments: str | bytes) -> T:
+        return self._validator.validate_json(arguments)  # type: ignore
+    
+    @functools.cached_property
+    def openai_tool(self):
+        # schema generation walks the whole pydantic model, only do it once per tool
+        return openai.pydantic_function_tool(self.schema)
     
-    async def execute(self, input: T, approval_hook: "ApprovalHook | None" = None) -> str:
+    async def execute(
+        self,
+        input: T,
+        approval_hook: "ApprovalHook | None" = None,
+        conversation: "Conversation | None" = None,
+    ) -> str:
+        if self._lock is None:
+            return await self._execute(input, approval_hook, conversation)
+        async with self._lock:
+            return await self._execute(input, approval_hook, conversation)
+    
+    async def _execute(
+        self,
+        input: T,
+        approval_hook: "ApprovalHook | None" = None,
+        conversation: "Conversation | None" = None,
+    ) -> str:
         fn = self.function
-        
-        # Check if function accepts approval_hook parameter
-        sig = inspect.signature(fn)
-        accepts_approval_hook = 'approval_hook' in sig.parameters
 
         # Build kwargs based on function signature
         kwargs = {}
-        if accepts_approval_hook:
+        if self._accepts_hook:
             kwargs['approval_hook'] = approval_hook
+        if self._accepts_conversation:
+            kwargs['conversation'] = conversation
 
         # Call the function with appropriate parameters
-        if inspect.iscoroutinefunction(fn):
+        if self._is_coro:
             # Async function - await directly
             return await fn(input, **kwargs)
         else:
@@ -1,65 +1,85 @@
 from typing import Awaitable, Callable, Dict, Tuple, Any, List, Optional
-from json import loads
 import discord
 from pydantic import BaseModel
 import importlib
 import pkgutil
-import json
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
 import logging
 from datetime import datetime
-import sys
 
+from computer._json import dumps_bytes, loads
 from computer.conversation import Conversation
 from computer.tasks.task import Task, TaskParams
 from computer.tools.tool import Tool
 
 logger = logging.getLogger(__name__)
 
+# tools found by the first discover_tools call, reused for the rest of the process
+_TOOLS_CACHE: List[Tool] | None = None
+
+# role -> (label, preview length) for the history listing; other roles are left out
+_HISTORY_ROLES: Dict[str, Tuple[str, int]] = {
+    "system": ("SYSTEM", 100),
+    "user": ("USER", 100),
+    "assistant": ("ASSISTANT", 100),
+    "tool": ("TOOL", 80),
+}
+
+def _import_tool_module(modname: str) -> ModuleType | None:
+    full_module_name = f'computer.tools.{modname}'
+    logger.debug(f"Scanning module: {full_module_name}")
+    try:
+        return importlib.import_module(full_module_name)
+    except Exception as e:
+        # Skip modules that fail to import
+        logger.warning(f"Could not load tool module {modname}: {e}")
+        return None
 
 def discover_tools() -> List[Tool]:
     """Discover all functions decorated with @tool in computer.tools submodules.
     
+    Discovery runs once per process; later calls return the same list.
+    
     Returns:
         A list of Tool instances from all decorated functions found in the package.
     """
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is not None:
+        return _TOOLS_CACHE
     logger.info("Starting tool discovery")
     import computer.tools as tools_package
-    import inspect
     
     registered_tools = []
     
-    # Iterate through all submodules in computer.tools
-    for _, modname, _ in pkgutil.iter_modules(tools_package.__path__):
-        # Skip __pycache__ and other non-module entries
-        if modname.startswith('_'):
-            continue
-            
-        try:
-            # Import the submodule
-            full_module_name = f'computer.tools.{modname}'
-            logger.debug(f"Scanning module: {full_module_name}")
-            module = importlib.import_module(full_module_name)
-            
-            # Iterate through all members of the module
-            for name, obj in inspect.getmembers(module):
-                # Check if it's a function decorated with @tool (has registered attribute)
-                if callable(obj) and hasattr(obj, 'registered'):
-                    try:
-                        tool_instance = obj.registered()  # type: ignore
-                        # Only register if platform matches or is platform-agnostic
-                        current_platform = "windows" if sys.platform == "win32" else "linux"
-                        if tool_instance.platform is None or tool_instance.platform == current_platform:
-                            registered_tools.append(tool_instance)
-                            logger.info(f"Registered tool: {tool_instance.name} from {modname}")
-                    except Exception as e:
-                        logger.warning(f"Could not register tool {name} from {modname}: {e}")
-                
-        except Exception as e:
-            # Skip modules that fail to import
-            logger.warning(f"Could not load tool module {modname}: {e}")
+    # Skip __pycache__ and other non-module entries, and the decorator module itself
+    modnames = [
+        modname for _, modname, _ in pkgutil.iter_modules(tools_package.__path__)
+        if not (modname.startswith('_') or modname == 'tool')
+    ]
+    
+    # Tool modules construct API clients and pull in heavy libraries at import time,
+    # import them side by side so startup waits on the slowest one rather than the sum
+    with ThreadPoolExecutor(max_workers=8, thread_name_prefix='tool-import') as executor:
+        modules = list(executor.map(_import_tool_module, modnames))
+    
+    for modname, module in zip(modnames, modules):
+        if module is None:
             continue
+        # Iterate through the module's own namespace (no getattr walk like inspect.getmembers)
+        for name, obj in vars(module).items():
+            # Check if it's a function decorated with @tool (has registered attribute)
+            if callable(obj) and hasattr(obj, 'registered'):
+                try:
+                    # wrong-platform tools are never marked registered by @tool
+                    tool_instance = obj.registered()  # type: ignore
+                    registered_tools.append(tool_instance)
+                    logger.info(f"Registered tool: {tool_instance.name} from {modname}")
+                except Exception as e:
+                    logger.warning(f"Could not register tool {name} from {modname}: {e}")
     
     logger.info(f"Discovered {len(registered_tools)} tools: {[tool.name for tool in registered_tools]}")
+    _TOOLS_CACHE = registered_tools
     return registered_tools
 
 
@@ -71,14 +91,13 @@ def discover_tasks() -> List[Task[TaskParams]]:
     """
     logger.info("Starting task discovery")
     import computer.tasks as tasks_package
-    import inspect
     
     registered_tasks = []
     
     # Iterate through all submodules in computer.tasks
     for _, modname, _ in pkgutil.iter_modules(tasks_package.__path__):
-        # Skip __pycache__ and other non-module entries
-        if modname.startswith('_'):
+        # Skip __pycache__ and other non-module entries, and the decorator module itself
+        if modname.startswith('_') or modname == 'task':
             continue
             
         try:
@@ -87,8 +106,8 @@ def discover_tasks() -> List[Task[TaskParams]]:
             logger.debug(f"Scanning module: {full_module_name}")
             module = importlib.import_module(full_module_name)
             
-            # Iterate through all members of the module
-            for name, obj in inspect.getmembers(module):
+            # Iterate through the module's own namespace (no getattr walk like inspect.getmembers)
+            for name, obj in vars(module).items():
                 # Check if it's a function decorated with @task (has registered attribute)
                 if callable(obj) and hasattr(obj, 'registered'):
                     try:
@@ -113,7 +132,7 @@ def parse_tool_call[T: BaseModel](
     """Parse a tool call and return the validated Pydantic object and function.
     
     Args:
-        tool_call: Dict containing 'name' and 'arguments' (JSON string)
+        tool_call: Dict with 'function' holding 'name' and 'arguments_chunks' (JSON string fragments)
         tool_models: Mapping of tool names to Pydantic model classes
         tool_commands: Mapping of tool names to callable functions
         
@@ -122,8 +141,9 @@ def parse_tool_call[T: BaseModel](
         If successful, returns (object, function, None).
         If failed, returns (None, None, error_message).
     """
-    tool_name = tool_call.get("name")
-    tool_args_str = tool_call.get("arguments", "{}")
+    function = tool_call.get("function", {})
+    tool_name = function.get("name")
+    tool_args_str = "".join(function.get("arguments_chunks", ())) or "{}"
     
     if not tool_name:
         logger.error("Tool call missing name")
@@ -135,9 +155,7 @@ def parse_tool_call[T: BaseModel](
     
     try:
         tool = tools_by_name[tool_name]
-        tool_model = tool.schema
-        tool_args_json = loads(tool_args_str)
-        tool_input = tool_model(**tool_args_json)
+        tool_input = tool.validate_json(tool_args_str)
         
         logger.debug(f"Successfully parsed tool call for '{tool_name}'")
         return tool, tool_input, None
@@ -222,21 +240,14 @@ class CommandHelpers:
         lines = []
         for i, msg in enumerate(history):
             role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            
-            if role == "system":
-                preview = content[:100] + "..." if len(content) > 100 else content
-                lines.append(f"[{i}] SYSTEM: {preview}")
-            elif role == "user":
-                preview = content[:100] + "..." if len(content) > 100 else content
-                lines.append(f"[{i}] USER: {preview}")
-            elif role == "assistant":
-                preview = content[:100] + "..." if len(content) > 100 else content
-                lines.append(f"[{i}] ASSISTANT: {preview}")
-            elif role == "tool":
-                tool_id = msg.get("tool_call_id", "")
-                preview = content[:80] + "..." if len(content) > 80 else content
-                lines.append(f"[{i}] TOOL ({tool_id}): {preview}")
+            if role not in _HISTORY_ROLES:
+                continue
+            tag, cut = _HISTORY_ROLES[role]
+            content = msg.get("content") or ""
+            preview = f"{content[:cut]}..." if len(content) > cut else content
+            if role == "tool":
+                tag = f"{tag} ({msg.get('tool_call_id', '')})"
+            lines.append(f"[{i}] {tag}: {preview}")
         
         result = "\n".join(lines)
         
@@ -270,8 +281,8 @@ class CommandHelpers:
             Tuple of (success, message)
         """
         try:
-            with open(filename, "w") as f:
-                json.dump(history.serialize(), f, indent=2)
+            with open(filename, "wb") as f:
+                f.write(dumps_bytes(history.serialize(), indent=True))
             return True, f"History saved to {filename}"
         except Exception as e:
             return False, f"Error saving history: {e}"
@@ -287,8 +298,8 @@ class CommandHelpers:
             Tuple of (history or None, timestamp, message)
         """
         try:
-            with open(filename, "r") as f:
-                data = json.load(f)
+            with open(filename, "rb") as f:
+                data = loads(f.read())
                 history = Conversation.deserialize(data)
                 timestamp = data.get("time", "unknown")
                 return history, timestamp, f"History loaded from {filename} (saved at {timestamp})"